@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Compare import time and memory of the `fa_icons` dict against the compact `fa_icons_table`.
+
+Each variant is imported in a fresh interpreter (with warm .pyc files) and resolves the icons of a
+typical config, the best time over `--runs` runs and the resident memory it added are reported.
+
+    python3 benchmarks/bench_icons.py
+"""
+
+import argparse
+import json
+import os.path
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+NAMES = ('firefox', 'chrome', 'terminal', 'envelope', 'edit', 'folder-open', 'music', 'play', 'comment',
+         'question', 'code', 'file-pdf', 'slack', 'spotify', 'steam', 'image', 'video', 'book', 'cog', 'skype')
+
+PROBE = '''
+import json, sys, time
+
+def rss_kib():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * {page_size} // 1024
+
+before = rss_kib()
+start = time.perf_counter()
+{code}
+glyphs = [resolve(name) for name in {names!r}]
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'rss_kib': rss_kib() - before, 'found': sum(g is not None for g in glyphs)}}))
+'''
+
+VARIANTS = (
+    ('fa_icons dict', 'from fa_icons import icons\nresolve = icons.get'),
+    ('fa_icons_table', 'from fa_icons_table import lookup as resolve'),
+)
+
+
+def measure(code, runs):
+    probe = PROBE.format(code=code, names=NAMES, page_size=os.sysconf('SC_PAGE_SIZE'))
+    results = [json.loads(subprocess.check_output([sys.executable, '-c', probe], cwd=ROOT)) for _ in range(runs)]
+    return min(r['ms'] for r in results), min(r['rss_kib'] for r in results), results[0]['found']
+
+
+def main():
+    parser = argparse.ArgumentParser(__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20)
+    options = parser.parse_args()
+
+    # compile both modules once so that every run loads them from .pyc
+    subprocess.check_call([sys.executable, '-m', 'compileall', '-q', 'fa_icons.py', 'fa_icons_table.py'], cwd=ROOT)
+    print('{:<16} {:>10} {:>10} {:>6}'.format('module', 'import_ms', 'rss_kib', 'found'))
+    for name, code in VARIANTS:
+        ms, rss, found = measure(code, options.runs)
+        print('{:<16} {:>10.3f} {:>10} {:>6}'.format(name, ms, rss, found))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Synthetic-scale benchmark of the rename pipeline.
+
+Generates i3 trees and app-icon configs of increasing size, serves them from a fake connection
+and replays a realistic mix of window/workspace events through `WorkspaceRenamer`, reporting
+per-event latency percentiles, requests made to i3 and the peak memory allocated while handling
+an event.
+
+Runs offline, no X server or i3 is needed.
+
+    python3 benchmarks/bench_rename.py
+    python3 benchmarks/bench_rename.py --workspaces 500 --leaves 10000 --rules 2000
+"""
+
+import argparse
+import json
+import os.path
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import i3ipc  # noqa: E402
+from fa_icons import icons  # noqa: E402
+from i3_workspace_names_daemon import AppIconRules, WorkspaceRenamer  # noqa: E402
+
+# (class, instance, weight, title templates)
+APPS = (
+    ('firefox', 'Navigator', 20, ('{words} - Mozilla Firefox', '{words} — Mozilla Firefox')),
+    ('Google-chrome', 'google-chrome', 15, ('{words} - Google Chrome',)),
+    ('URxvt', 'urxvt', 15, ('{user}@{host}: {path}', 'vim {path}', 'htop')),
+    ('kitty', 'kitty', 10, ('{user}@{host}: {path}', 'python3 {path}')),
+    ('jetbrains-idea-ce', 'jetbrains-idea-ce', 5, ('{project} – {path}',)),
+    ('Thunderbird', 'Mail', 5, ('Inbox - {user}@{host} - Mozilla Thunderbird',)),
+    ('Slack', 'slack', 8, ('Slack | {words} | {project}',)),
+    ('Signal', 'signal', 3, ('Signal',)),
+    ('vlc', 'vlc', 2, ('{words}.mkv - VLC media player',)),
+    ('Org.gnome.Nautilus', 'org.gnome.Nautilus', 4, ('{path}',)),
+    ('Code', 'code', 8, ('{path} - {project} - Visual Studio Code',)),
+    ('Zathura', 'zathura', 3, ('{path}.pdf',)),
+    ('Gimp-2.10', 'gimp-2.10', 2, ('[{words}] (imported)-1.0 (RGB color 8-bit gamma integer) – GIMP',)),
+)
+WORDS = ('the', 'python', 'regex', 'workspace', 'i3wm', 'daemon', 'icons', 'performance', 'news', 'issue',
+         'pull', 'request', 'review', 'release', 'notes', 'docs', 'video', 'search', 'results', 'github')
+# rules a real config would contain, the rest of a large config is padded with unrelated applications
+BASE_RULES = (
+    ('firefox', 'firefox'), ('navigator', 'firefox'), ('google-chrome', 'chrome'), ('chromium', 'chrome'),
+    ('urxvt', 'terminal'), ('kitty', 'terminal'), ('x-terminal-emulator', 'terminal'),
+    ('jetbrains-.*', 'edit'), ('thunderbird', 'envelope'), ('slack', 'slack'), ('signal', 'comment'),
+    ('vlc', 'play'), ('org.gnome.nautilus', 'folder-open'), ('code', 'code'), ('.*zathura.*', 'file-pdf'),
+)
+RECT = {'x': 0, 'y': 0, 'width': 1920, 'height': 1080}
+
+
+class Reply:
+    def __init__(self, success=True):
+        self.success = success
+        self.error = None
+
+
+class FakeConnection:
+    """Stand-in for `i3ipc.Connection` serving a generated tree.
+
+    The tree is kept as plain data, `get_tree` serialises and parses it like the real connection
+    does, and `command` applies workspace renames to it.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.calls = Counter()
+        self.bytes_sent = 0
+
+    def get_tree(self):
+        self.calls['get_tree'] += 1
+        return i3ipc.Con(json.loads(json.dumps(self.session.tree())), None, self)
+
+    def get_workspaces(self):
+        self.calls['get_workspaces'] += 1
+        return []
+
+    def command(self, payload):
+        self.calls['command'] += 1
+        self.bytes_sent += len(payload.encode('utf-8'))
+        replies = []
+        for command in filter(None, payload.split(';')):
+            old, new = command[len('rename workspace "'):-1].split('" to "')
+            replies.append(Reply(self.session.rename(old.replace('\\"', '"'), new.replace('\\"', '"'))))
+        return replies
+
+
+class Session:
+    """Generated set of workspaces and windows, mutated by the events it emits.
+
+    The workspaces are spread over `outputs` outputs, the first workspace of each is shown on it to
+    begin with and focusing a workspace shows it on its output.
+    """
+
+    # relative frequency of title, new, close, move and focus events
+    weights = (80, 5, 5, 5, 5)
+
+    def __init__(self, workspaces, leaves, rng, outputs=1):
+        self.rng = rng
+        self._next_id = 1000
+        self.outputs = ['DP-{}'.format(i + 1) for i in range(outputs)]
+        self.workspaces = [self._con('workspace', str(num), num=num, output=self.outputs[(num - 1) % outputs])
+                           for num in range(1, workspaces + 1)]
+        # output -> id of the workspace shown on it
+        self.visible = {}
+        for workspace in self.workspaces:
+            self.visible.setdefault(workspace['output'], workspace['id'])
+        for _ in range(leaves):
+            self.rng.choice(self.workspaces)['nodes'].append(self.new_leaf())
+
+    def _con(self, type, name, **kwargs):
+        self._next_id += 1
+        con = {'id': self._next_id, 'type': type, 'name': name, 'rect': RECT, 'nodes': [], 'floating_nodes': []}
+        con.update(kwargs)
+        return con
+
+    def _title(self, templates):
+        return self.rng.choice(templates).format(
+            words=' '.join(self.rng.choice(WORDS) for _ in range(self.rng.randint(2, 12))),
+            user='user', host='host{}'.format(self.rng.randint(1, 9)), project=self.rng.choice(WORDS),
+            path='/'.join(self.rng.choice(WORDS) for _ in range(self.rng.randint(1, 6))))
+
+    def new_leaf(self):
+        cls, instance, _, templates = self.rng.choices(APPS, weights=[app[2] for app in APPS])[0]
+        title = self._title(templates)
+        return self._con('con', title, window=self._next_id,
+                         window_properties={'class': cls, 'instance': instance, 'title': title})
+
+    def retitle(self, leaf):
+        templates = next(app[3] for app in APPS if app[0] == leaf['window_properties']['class'])
+        leaf['name'] = leaf['window_properties']['title'] = self._title(templates)
+
+    def tree(self):
+        outputs = []
+        for name in self.outputs:
+            workspaces = [w for w in self.workspaces if w['output'] == name]
+            # the shown workspace comes first in the focus order
+            focus = [self.visible[name]] + [w['id'] for w in workspaces if w['id'] != self.visible[name]]
+            content = self._con('con', 'content', nodes=workspaces, focus=focus)
+            outputs.append(self._con('output', name, nodes=[content]))
+        return self._con('root', 'root', nodes=outputs)
+
+    def rename(self, old, new):
+        for workspace in self.workspaces:
+            if workspace['name'] == old:
+                workspace['name'] = new
+                return True
+        return False
+
+    def next_change(self):
+        """Mutate the session and return the event i3 would send for it.
+
+        Returns
+        -------
+        (str, str, dict)
+            The event type ('window' or 'workspace'), the change and the container (or workspace) payload.
+        """
+        populated = [w for w in self.workspaces if w['nodes']]
+        kind = self.rng.choices(('title', 'new', 'close', 'move', 'focus'), weights=self.weights)[0]
+        if kind != 'new' and not populated:
+            kind = 'new'
+        if kind == 'title':
+            leaf = self.rng.choice(self.rng.choice(populated)['nodes'])
+            self.retitle(leaf)
+        elif kind == 'new':
+            leaf = self.new_leaf()
+            self.rng.choice(self.workspaces)['nodes'].append(leaf)
+        elif kind == 'close':
+            workspace = self.rng.choice(populated)
+            leaf = workspace['nodes'].pop(self.rng.randrange(len(workspace['nodes'])))
+        elif kind == 'move':
+            workspace = self.rng.choice(populated)
+            leaf = workspace['nodes'].pop(self.rng.randrange(len(workspace['nodes'])))
+            self.rng.choice(self.workspaces)['nodes'].append(leaf)
+        else:
+            workspace = self.rng.choice(self.workspaces)
+            self.visible[workspace['output']] = workspace['id']
+            return 'workspace', 'focus', workspace
+        return 'window', kind, leaf
+
+    def next_event(self, conn):
+        """Same as `next_change`, as an i3ipc event."""
+        event_type, change, con = self.next_change()
+        if event_type == 'workspace':
+            return i3ipc.WorkspaceEvent({'change': change, 'current': con}, conn)
+        return i3ipc.WindowEvent({'change': change, 'container': con}, conn)
+
+
+def make_app_icons(size, rng):
+    """Build an app-icon config with `size` rules, the realistic ones spread through it."""
+    icon_names = sorted(icons)
+    app_icons = {}
+    while len(app_icons) < size - len(BASE_RULES):
+        app_icons['app-{}-{}'.format(rng.choice(WORDS), len(app_icons))] = rng.choice(icon_names)
+    items = list(app_icons.items())
+    for rule in BASE_RULES[:size]:
+        items.insert(rng.randrange(len(items) + 1), rule)
+    return dict(items)
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+def run(workspaces, leaves, rules, events, seed, options):
+    rng = random.Random(seed)
+    session = Session(workspaces, leaves, rng)
+    conn = FakeConnection(session)
+    args = argparse.Namespace(delimiter='|', max_title_length=12, uniq=options.uniq, no_match_not_show_name=False,
+                              verbose=False, label_cache_size=options.label_cache_size,
+                              output_scoped=False, rule_budget_ms=0, max_match_length=0)
+    renamer = WorkspaceRenamer(AppIconRules(make_app_icons(rules, rng)), args)
+
+    # first event pays for the initial tree, report it separately
+    start = time.perf_counter()
+    renamer.rename_events(conn, [session.next_event(conn)])
+    cold = time.perf_counter() - start
+
+    conn.calls.clear()
+    latencies = []
+    for _ in range(events):
+        # events are generated one at a time so that the tree i3 would serve matches the event
+        e = session.next_event(conn)
+        start = time.perf_counter()
+        renamer.rename_events(conn, [e])
+        latencies.append(time.perf_counter() - start)
+    calls = dict(conn.calls)
+
+    # allocations are measured on a separate, shorter, run as tracing slows everything down
+    traced = min(events, 200)
+    allocated = 0
+    tracemalloc.start()
+    for _ in range(traced):
+        e = session.next_event(conn)
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        renamer.rename_events(conn, [e])
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - before
+    tracemalloc.stop()
+
+    return {
+        'workspaces': workspaces, 'leaves': leaves, 'rules': rules, 'events': events,
+        'cold_ms': cold * 1000,
+        'p50_us': percentile(latencies, 50) * 1e6,
+        'p90_us': percentile(latencies, 90) * 1e6,
+        'p99_us': percentile(latencies, 99) * 1e6,
+        'max_us': max(latencies) * 1e6,
+        'ipc_per_event': sum(calls.values()) / events,
+        'get_tree_per_event': calls.get('get_tree', 0) / events,
+        'alloc_kib_per_event': allocated / traced / 1024,
+    }
+
+
+COLUMNS = ('workspaces', 'leaves', 'rules', 'cold_ms', 'p50_us', 'p90_us', 'p99_us', 'max_us',
+           'ipc_per_event', 'get_tree_per_event', 'alloc_kib_per_event')
+
+
+def main():
+    parser = argparse.ArgumentParser(__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workspaces', type=int, nargs='+', default=[10, 50, 500])
+    parser.add_argument('--leaves', type=int, nargs='+', default=[10, 1000, 10000])
+    parser.add_argument('--rules', type=int, nargs='+', default=[10, 200, 2000])
+    parser.add_argument('--events', type=int, default=1000, help='Events replayed per scenario.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--uniq', action='store_true')
+    parser.add_argument('--label-cache-size', type=int, default=1024)
+    parser.add_argument('--json', action='store_true', help='Print one JSON object per scenario.')
+    options = parser.parse_args()
+
+    if not options.json:
+        print(' '.join('{:>12}'.format(c) for c in COLUMNS))
+    for workspaces in options.workspaces:
+        for leaves in options.leaves:
+            for rules in options.rules:
+                result = run(workspaces, leaves, rules, options.events, options.seed, options)
+                if options.json:
+                    print(json.dumps(result))
+                else:
+                    print(' '.join('{:>12.4g}'.format(result[c]) if isinstance(result[c], float)
+                                   else '{:>12}'.format(result[c]) for c in COLUMNS))
+                sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Randomized check that the indexed rule matcher finds the same rule as matching the rules one by one.
+
+Generates random app-icon configs mixing plain names, names anchored with `$`, true regexes and
+characters that only match case-insensitively (eg. the Kelvin sign), and random window identifiers
+to match them against. Each rule set is compared with a sequential `re.match(..., re.IGNORECASE)`
+over the rules in config order, in every way it can match (as one alternation, rule by rule and as
+timed by the rule budget), and `WorkspaceRenamer.get_icon_or_name` is compared with the label the
+daemon built before the rules were indexed. Exits non-zero on the first config that differs.
+
+Runs offline, no X server or i3 is needed.
+
+    python3 benchmarks/check_matcher.py
+    python3 benchmarks/check_matcher.py --configs 10000 --seed 7
+"""
+
+import argparse
+import os.path
+import random
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from i3_workspace_names_daemon import RULE_IDENTIFIERS, AppIconRules, Leaf, WorkspaceRenamer  # noqa: E402
+
+# pieces of application-name regexes, some of them only match case-insensitively or aren't ASCII
+RULE_PIECES = ('a', 'b', 'k', 's', 'i', 'I', 'K', 'S', '-', '.', '\\.', '\\-', ' ', 'K', 'ſ', 'İ',
+               'ı', 'é', '\n', 'x*', '(a|b)', '[ks]', '\\d', '^', '(?:ab)?', '(a)\\1')
+# characters of window identifiers
+NAME_CHARS = ('a', 'b', 'k', 's', 'i', 'I', 'K', 'S', '-', '.', ' ', 'K', 'ſ', 'İ', 'ı',
+              'é', 'É', '\n', '1', 'x')
+GLYPHS = ('', '', '', '', '', '', '', '')
+
+
+def random_rules(rng):
+    """Get random (application-name regex, glyph) rules and the identifiers each one applies to."""
+    resolved = {}
+    for _ in range(rng.randint(1, 10)):
+        name_re = ''.join(rng.choice(RULE_PIECES) for _ in range(rng.randint(0, 5)))
+        if rng.random() < 0.3:
+            name_re += '$'
+        try:
+            re.compile(name_re)
+        except re.error:
+            continue
+        resolved.setdefault(name_re, rng.choice(GLYPHS))
+    targets = [None if rng.random() < 0.6 else rng.sample(list(RULE_IDENTIFIERS), rng.randint(1, 3))
+               for _ in resolved]
+    return list(resolved.items()), targets
+
+
+def random_name(rng):
+    if rng.random() < 0.1:
+        return None
+    return ''.join(rng.choice(NAME_CHARS) for _ in range(rng.randint(0, 8)))
+
+
+def first_match(resolved, name):
+    """Glyph of the first rule whose regex matches `name`, matching them one by one."""
+    return next((glyph for name_re, glyph in resolved if re.match(name_re, name, re.IGNORECASE)), None)
+
+
+def applying(resolved, targets, identifier):
+    """The rules that apply to a window identifier."""
+    return [rule for rule, t in zip(resolved, targets) if t is None or identifier in t]
+
+
+def baseline_label(resolved, targets, no_match, leaf, length):
+    """Label of a window the way `get_icon_or_name` built it before the rules were indexed."""
+    for identifier, attribute in RULE_IDENTIFIERS.items():
+        name = getattr(leaf, attribute)
+        if name is None:
+            continue
+        glyph = first_match(applying(resolved, targets, identifier), name)
+        if glyph is not None:
+            return glyph
+    if name:
+        if no_match is not None:
+            return no_match + name
+        return name[:length]
+    return '?'
+
+
+def check_config(rng, args, names):
+    """Match random names against one random config, get a description of the first difference or None."""
+    resolved, targets = random_rules(rng)
+    no_match = rng.choice((None, ''))
+    rules = AppIconRules.from_resolved(resolved, no_match, targets=targets)
+    # as loaded from the rule cache, trusting the number of groups rather than compiling every regex
+    cached = AppIconRules.from_resolved(resolved, no_match, rules.groups, targets)
+    for _ in range(names):
+        name = random_name(rng) or ''
+        identifier = rng.choice(list(RULE_IDENTIFIERS))
+        expected = first_match(applying(resolved, targets, identifier), name)
+        for label, matched in (('match', rules.match(name, identifier)),
+                               ('cached match', cached.match(name, identifier)),
+                               ('timed match', rules.rule_set(identifier).match(name, []))):
+            if matched != expected:
+                return '{} of {} {!r} against {!r} for {!r}: {!r}, expected {!r}'.format(
+                    label, identifier, name, resolved, targets, matched, expected)
+    renamer = WorkspaceRenamer(rules, args)
+    for _ in range(names):
+        leaf = Leaf(0, random_name(rng), random_name(rng), random_name(rng), random_name(rng))
+        expected = baseline_label(resolved, targets, no_match, leaf, args.max_title_length)
+        label = renamer.get_icon_or_name(leaf, args.max_title_length)
+        if label != expected:
+            return 'label of {!r} with {!r} for {!r}: {!r}, expected {!r}'.format(
+                leaf, resolved, targets, label, expected)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--configs', type=int, default=3000)
+    parser.add_argument('--names', type=int, default=30, help='names matched against each config')
+    parser.add_argument('--seed', type=int, default=0)
+    options = parser.parse_args()
+
+    rng = random.Random(options.seed)
+    args = argparse.Namespace(max_title_length=12, delimiter='|', uniq=False, no_match_not_show_name=False,
+                              verbose=False, label_cache_size=1024, output_scoped=False, rule_budget_ms=0,
+                              max_match_length=0)
+    for i in range(options.configs):
+        difference = check_config(rng, args, options.names)
+        if difference is not None:
+            print('config {}: {}'.format(i, difference))
+            sys.exit(1)
+    print('{} configs, {} names each: the same rules match'.format(options.configs, options.names))
+
+
+if __name__ == '__main__':
+    main()
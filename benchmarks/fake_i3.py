@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""Stand-in i3 that speaks the i3 IPC protocol over a Unix socket, for end-to-end latency runs.
+
+Serves GET_TREE, GET_WORKSPACES, GET_OUTPUTS and GET_VERSION from a generated session (see
+`bench_rename.Session`), applies `rename workspace` commands to it and pushes window/workspace
+events to subscribers at a configurable rate.
+
+By default it starts the real daemon against the socket, replays an event storm and reports
+event-to-rename latency and throughput. Arguments after `--` are passed to the daemon:
+
+    python3 benchmarks/fake_i3.py --rate 500 --duration 10 -- --debounce-ms 20
+
+With `--serve` it only serves the socket (and emits events), to point any i3ipc client at it.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import os.path
+import random
+import re
+import struct
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_rename import BASE_RULES, Session, percentile  # noqa: E402
+import i3ipc  # noqa: E402
+from i3_workspace_names_daemon import AppIconRules, WorkspaceRenamer  # noqa: E402
+
+DAEMON = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'i3_workspace_names_daemon.py')
+
+MAGIC = b'i3-ipc'
+HEADER = struct.Struct('=6sII')
+
+RUN_COMMAND = 0
+GET_WORKSPACES = 1
+SUBSCRIBE = 2
+GET_OUTPUTS = 3
+GET_TREE = 4
+GET_VERSION = 7
+
+EVENT_TYPES = {'workspace': 0, 'output': 1, 'mode': 2, 'window': 3, 'barconfig_update': 4, 'binding': 5,
+               'shutdown': 6, 'tick': 7}
+
+RENAME_RE = re.compile(r'\s*rename workspace "((?:[^"\\]|\\.)*)" to "((?:[^"\\]|\\.)*)"\s*(?:;|$)')
+UNESCAPE_RE = re.compile(r'\\(.)')
+
+
+def pack(message_type, payload):
+    data = json.dumps(payload).encode('utf-8')
+    return HEADER.pack(MAGIC, len(data), message_type) + data
+
+
+class FakeI3Server:
+    """i3 IPC server backed by a `Session`.
+
+    Parameters
+    ----------
+    session: `bench_rename.Session`
+    path: `str`
+        Path of the Unix socket to listen on.
+    """
+
+    def __init__(self, session, path):
+        self.session = session
+        self.path = path
+        self.requests = Counter()
+        self.events = Counter()
+        self.bytes_received = 0
+        self.renames = 0
+        self.failed_renames = 0
+        # workspace id -> send times of events still waiting for that workspace to be renamed
+        self.pending = {}
+        self.latencies = []
+        self.subscribed = asyncio.Event()
+        self._subscribers = {}
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_unix_server(self._client, self.path)
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+        for writer in list(self._subscribers):
+            writer.close()
+
+    async def _client(self, reader, writer):
+        try:
+            while True:
+                magic, length, message_type = HEADER.unpack(await reader.readexactly(HEADER.size))
+                if magic != MAGIC:
+                    break
+                payload = (await reader.readexactly(length)).decode('utf-8')
+                self.requests[message_type] += 1
+                writer.write(pack(message_type, self._handle(message_type, payload, writer)))
+                if message_type == SUBSCRIBE and 'tick' in json.loads(payload):
+                    # like i3, tell a new tick subscriber its subscription is in place
+                    self._send(writer, 'tick', {'first': True, 'payload': ''})
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._subscribers.pop(writer, None)
+            writer.close()
+
+    def _handle(self, message_type, payload, writer):
+        if message_type == RUN_COMMAND:
+            self.bytes_received += len(payload.encode('utf-8'))
+            return self._run_command(payload)
+        if message_type == SUBSCRIBE:
+            self._subscribers.setdefault(writer, set()).update(json.loads(payload))
+            self.subscribed.set()
+            return {'success': True}
+        if message_type == GET_TREE:
+            return self.session.tree()
+        if message_type == GET_WORKSPACES:
+            visible = set(self.session.visible.values())
+            return [{'id': w['id'], 'num': w['num'], 'name': w['name'], 'visible': w['id'] in visible,
+                     'focused': i == 0, 'urgent': False, 'output': w['output'], 'rect': w['rect']}
+                    for i, w in enumerate(self.session.workspaces)]
+        if message_type == GET_OUTPUTS:
+            names = {w['id']: w['name'] for w in self.session.workspaces}
+            return [{'name': name, 'active': True, 'primary': i == 0, 'current_workspace':
+                     names[self.session.visible[name]], 'rect': self.session.workspaces[0]['rect']}
+                    for i, name in enumerate(self.session.outputs)]
+        if message_type == GET_VERSION:
+            return {'major': 4, 'minor': 22, 'patch': 0, 'human_readable': '4.22 (fake)',
+                    'loaded_config_file_name': ''}
+        return []
+
+    def _run_command(self, payload):
+        replies = []
+        position = 0
+        while position < len(payload.rstrip()):
+            m = RENAME_RE.match(payload, position)
+            if m is None:
+                replies.append({'success': False, 'parse_error': True, 'error': 'unsupported command'})
+                break
+            position = m.end()
+            old, new = (UNESCAPE_RE.sub(r'\1', name) for name in m.groups())
+            workspace = next((w for w in self.session.workspaces if w['name'] == old), None)
+            if workspace is None or any(w['name'] == new for w in self.session.workspaces if w is not workspace):
+                self.failed_renames += 1
+                replies.append({'success': False, 'error': 'no workspace "{}"'.format(old)})
+                continue
+            workspace['name'] = new
+            self.renames += 1
+            now = time.perf_counter()
+            self.latencies.extend(now - sent for sent in self.pending.pop(workspace['id'], ()))
+            replies.append({'success': True})
+            self.emit('workspace', 'rename', workspace)
+        return replies
+
+    def emit(self, event_type, change, con):
+        """Send an event to every client subscribed to `event_type`."""
+        self.events['{}::{}'.format(event_type, change)] += 1
+        key = 'current' if event_type == 'workspace' else 'container'
+        for writer, events in list(self._subscribers.items()):
+            if event_type in events:
+                self._send(writer, event_type, {'change': change, key: con})
+
+    def _send(self, writer, event_type, event):
+        writer.write(pack((1 << 31) | EVENT_TYPES[event_type], event))
+
+    def emit_change(self):
+        """Mutate the session and send the resulting event."""
+        event_type, change, con = self.session.next_change()
+        if event_type == 'window' and change in ('new', 'move'):
+            # these always change the name of the workspace the window ends up in
+            workspace = next(w for w in self.session.workspaces if con in w['nodes'])
+            self.pending.setdefault(workspace['id'], []).append(time.perf_counter())
+        self.emit(event_type, change, con)
+
+
+def stale_workspaces(session):
+    """Count the workspaces whose name isn't what the daemon, with its default options, names them."""
+    args = argparse.Namespace(delimiter='|', max_title_length=12, uniq=False, no_match_not_show_name=False,
+                              verbose=False, label_cache_size=1024, output_scoped=False, rule_budget_ms=0,
+                              max_match_length=0)
+    commands, _ = WorkspaceRenamer(AppIconRules(dict(BASE_RULES)), args).name_tree(
+        i3ipc.Con(json.loads(json.dumps(session.tree())), None, None))
+    return len(commands)
+
+
+async def storm(server, rate, duration):
+    """Emit events at `rate` per second for `duration` seconds."""
+    tick = 0.005
+    start = time.perf_counter()
+    sent = 0
+    while time.perf_counter() - start < duration:
+        due = int((time.perf_counter() - start) * rate)
+        for _ in range(due - sent):
+            server.emit_change()
+        sent = max(sent, due)
+        await asyncio.sleep(tick)
+    return sent, time.perf_counter() - start
+
+
+async def run(options):
+    tmp = tempfile.mkdtemp(prefix='fake-i3-')
+    path = options.socket or os.path.join(tmp, 'ipc.sock')
+    session = Session(options.workspaces, options.leaves, random.Random(options.seed), options.outputs)
+    server = FakeI3Server(session, path)
+    await server.start()
+    print('serving i3 IPC on {}'.format(path), file=sys.stderr)
+
+    if options.serve:
+        try:
+            await server.subscribed.wait()
+            await storm(server, options.rate, options.duration)
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+        return
+
+    config = os.path.join(tmp, 'app-icons.json')
+    with open(config, 'w') as f:
+        json.dump(dict(BASE_RULES), f)
+    daemon_args = [a for a in options.daemon_args if a != '--']
+    daemon = await asyncio.create_subprocess_exec(sys.executable, DAEMON, '--socket-path', path,
+                                                  '-config-path', config, *daemon_args,
+                                                  stdout=asyncio.subprocess.DEVNULL)
+    try:
+        await asyncio.wait_for(server.subscribed.wait(), 10)
+        # let the daemon pick up the tree before the storm starts
+        server.emit_change()
+        await asyncio.sleep(0.5)
+        server.latencies.clear()
+        server.requests.clear()
+        server.events.clear()
+        server.renames = 0
+
+        sent, elapsed = await storm(server, options.rate, options.duration)
+        await asyncio.sleep(options.settle)
+    finally:
+        daemon.terminate()
+        await daemon.wait()
+        await server.stop()
+
+    latencies = server.latencies
+    result = {
+        'events_sent': sent,
+        'events_per_s': sent / elapsed,
+        'events': dict(server.events),
+        'requests': {name: server.requests[t] for name, t in
+                     (('command', RUN_COMMAND), ('get_tree', GET_TREE), ('get_workspaces', GET_WORKSPACES),
+                      ('get_outputs', GET_OUTPUTS))},
+        'renames': server.renames,
+        'failed_renames': server.failed_renames,
+        'command_bytes': server.bytes_received,
+        'unanswered_events': sum(len(times) for times in server.pending.values()),
+        # with the default naming options, 0 once the daemon caught up
+        'stale_workspaces': stale_workspaces(session),
+    }
+    if latencies:
+        result.update({'latency_ms_p{}'.format(p): percentile(latencies, p) * 1000 for p in (50, 90, 99)})
+        result['latency_ms_max'] = max(latencies) * 1000
+    print(json.dumps(result, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workspaces', type=int, default=20)
+    parser.add_argument('--leaves', type=int, default=200)
+    parser.add_argument('--outputs', type=int, default=1, help='Outputs to spread the workspaces over.')
+    parser.add_argument('--rate', type=float, default=200, help='Events per second.')
+    parser.add_argument('--duration', type=float, default=5, help='Length of the event storm in seconds.')
+    parser.add_argument('--settle', type=float, default=1, help='Seconds to wait for the daemon after the storm.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--socket', help='Socket path, defaults to one in a fresh temporary directory.')
+    parser.add_argument('--serve', action='store_true', help='Only serve the socket, do not start the daemon.')
+    parser.add_argument('daemon_args', nargs=argparse.REMAINDER, help='Options passed on to the daemon.')
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
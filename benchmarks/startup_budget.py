@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Check that the daemon starts within a time budget.
+
+Starts the daemon against the stand-in i3 from `fake_i3` (so no X server or i3 is needed) and
+measures the time from spawning it to its subscribing to events. The daemon is started a few
+times with a warm rule cache and the fastest start is compared with the budget; the per-phase
+report of `--startup-timing` is printed for that start. Exits non-zero when over budget.
+
+    python3 benchmarks/startup_budget.py --budget-ms 250
+    python3 benchmarks/startup_budget.py -- --async
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import os.path
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_rename import BASE_RULES, Session  # noqa: E402
+from fake_i3 import DAEMON, FakeI3Server  # noqa: E402
+
+
+async def start_once(server, config, env, daemon_args):
+    """Start the daemon, wait for it to subscribe and stop it again.
+
+    Returns
+    -------
+    (float, str)
+        Seconds from spawning the daemon to its subscription and its startup report.
+    """
+    server.subscribed.clear()
+    start = time.perf_counter()
+    daemon = await asyncio.create_subprocess_exec(sys.executable, DAEMON, '--socket-path', server.path,
+                                                  '-config-path', config, '--startup-timing', *daemon_args,
+                                                  stdout=asyncio.subprocess.PIPE, env=env)
+    try:
+        await asyncio.wait_for(server.subscribed.wait(), 10)
+        elapsed = time.perf_counter() - start
+        report = []
+        while not report or not report[-1].startswith('total'):
+            line = await asyncio.wait_for(daemon.stdout.readline(), 10)
+            if not line:
+                break
+            if report or line.startswith(b'startup phase'):
+                report.append(line.decode('utf-8').rstrip())
+    finally:
+        daemon.terminate()
+        await daemon.wait()
+    return elapsed, '\n'.join(report)
+
+
+async def run(options):
+    tmp = tempfile.mkdtemp(prefix='startup-budget-')
+    server = FakeI3Server(Session(10, 50, random.Random(0)), os.path.join(tmp, 'ipc.sock'))
+    await server.start()
+    config = os.path.join(tmp, 'app-icons.json')
+    with open(config, 'w') as f:
+        json.dump(dict(BASE_RULES), f)
+    # keep the rule cache of this run apart from the user's
+    env = dict(os.environ, XDG_CACHE_HOME=os.path.join(tmp, 'cache'))
+    daemon_args = [a for a in options.daemon_args if a != '--']
+    try:
+        cold = await start_once(server, config, env, daemon_args)
+        warm = min([await start_once(server, config, env, daemon_args) for _ in range(options.runs)])
+    finally:
+        await server.stop()
+
+    print(warm[1])
+    print('cold start {:.1f}ms, warm start {:.1f}ms (best of {}), budget {}ms'.format(
+        cold[0] * 1000, warm[0] * 1000, options.runs, options.budget_ms))
+    if warm[0] * 1000 > options.budget_ms:
+        print('over budget')
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-ms', type=float, default=250,
+                        help='Longest acceptable time from spawning the daemon to its subscription.')
+    parser.add_argument('--runs', type=int, default=5, help='Number of warm starts to take the fastest of.')
+    parser.add_argument('daemon_args', nargs=argparse.REMAINDER, help='Options passed on to the daemon.')
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == '__main__':
+    main()
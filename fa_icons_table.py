@@ -0,0 +1,1335 @@
+# Compact font-awesome icon-name to glyph table.
+#
+# Generated from fa_icons.py with `python3 fa_icons_table.py --regenerate`, do not edit the table by hand.
+#
+# Unlike `fa_icons.icons`, importing this module doesn't build a dict: the table is one bytes constant of
+# fixed-width records (the icon-name padded with spaces, then the glyph's code point as 2 big-endian bytes),
+# sorted by name, that is searched with a binary search for the few icons a config refers to.
+
+WIDTH = 35
+RECORD = WIDTH + 2
+
+
+def lookup(name):
+    """Get the glyph for an icon-name.
+
+    Parameters
+    ----------
+    name: `str`
+        Icon-name in the font-awesome gallery.
+
+    Returns
+    -------
+    str|None
+        The glyph or None if there is no icon with that name.
+    """
+    # names are padded with spaces in the table, one ending in a space would match the name without it
+    if not isinstance(name, str) or len(name) > WIDTH or not name.isascii() or name.endswith(' '):
+        return None
+    key = name.encode('ascii').ljust(WIDTH)
+    lo, hi = 0, COUNT
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if TABLE[mid * RECORD:mid * RECORD + WIDTH] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    start = lo * RECORD
+    if lo == COUNT or TABLE[start:start + WIDTH] != key:
+        return None
+    return chr(int.from_bytes(TABLE[start + WIDTH:start + RECORD], 'big'))
+
+
+def _regenerate():
+    import hashlib
+    from fa_icons import icons
+
+    width = max(len(name) for name in icons)
+    records = sorted(name.encode('ascii').ljust(width) + ord(glyph).to_bytes(2, 'big')
+                     for name, glyph in icons.items())
+    table = b''.join(records)
+    with open(__file__) as f:
+        source = f.read()
+    header = source[:source.index('\n# --- generated table ---\n') + 1]
+    header = header.replace('WIDTH = {}'.format(WIDTH), 'WIDTH = {}'.format(width), 1)
+    lines = [header, '# --- generated table ---\n',
+             'VERSION = {!r}\n'.format(hashlib.sha1(table).hexdigest()[:12]),
+             'COUNT = {}\n'.format(len(records)),
+             'TABLE = (\n']
+    lines.extend('    {!r}\n'.format(record) for record in records)
+    lines.append(')\n')
+    with open(__file__, 'w') as f:
+        f.write(''.join(lines))
+
+
+if __name__ == '__main__':
+    import sys
+
+    if sys.argv[1:] != ['--regenerate']:
+        raise SystemExit('usage: python3 fa_icons_table.py --regenerate')
+    _regenerate()
+
+
+# --- generated table ---
+VERSION = 'f2282a34be77'
+COUNT = 1258
+TABLE = (
+    b'500px                              \xf2n'
+    b'accessible-icon                    \xf3h'
+    b'accusoft                           \xf3i'
+    b'acquisitions-incorporated          \xf6\xaf'
+    b'ad                                 \xf6A'
+    b'address-book                       \xf2\xb9'
+    b'address-card                       \xf2\xbb'
+    b'adjust                             \xf0B'
+    b'adn                                \xf1p'
+    b'adversal                           \xf3j'
+    b'affiliatetheme                     \xf3k'
+    b'air-freshener                      \xf5\xd0'
+    b'algolia                            \xf3l'
+    b'align-center                       \xf07'
+    b'align-justify                      \xf09'
+    b'align-left                         \xf06'
+    b'align-right                        \xf08'
+    b'alipay                             \xf6B'
+    b'allergies                          \xf4a'
+    b'amazon                             \xf2p'
+    b'amazon-pay                         \xf4,'
+    b'ambulance                          \xf0\xf9'
+    b'american-sign-language-interpreting\xf2\xa3'
+    b'amilia                             \xf3m'
+    b'anchor                             \xf1='
+    b'android                            \xf1{'
+    b'angellist                          \xf2\t'
+    b'angle-double-down                  \xf1\x03'
+    b'angle-double-left                  \xf1\x00'
+    b'angle-double-right                 \xf1\x01'
+    b'angle-double-up                    \xf1\x02'
+    b'angle-down                         \xf1\x07'
+    b'angle-left                         \xf1\x04'
+    b'angle-right                        \xf1\x05'
+    b'angle-up                           \xf1\x06'
+    b'angry                              \xf5V'
+    b'angrycreative                      \xf3n'
+    b'angular                            \xf4 '
+    b'ankh                               \xf6D'
+    b'app-store                          \xf3o'
+    b'app-store-ios                      \xf3p'
+    b'apper                              \xf3q'
+    b'apple                              \xf1y'
+    b'apple-alt                          \xf5\xd1'
+    b'apple-pay                          \xf4\x15'
+    b'archive                            \xf1\x87'
+    b'archway                            \xf5W'
+    b'arrow-alt-circle-down              \xf3X'
+    b'arrow-alt-circle-left              \xf3Y'
+    b'arrow-alt-circle-right             \xf3Z'
+    b'arrow-alt-circle-up                \xf3['
+    b'arrow-circle-down                  \xf0\xab'
+    b'arrow-circle-left                  \xf0\xa8'
+    b'arrow-circle-right                 \xf0\xa9'
+    b'arrow-circle-up                    \xf0\xaa'
+    b'arrow-down                         \xf0c'
+    b'arrow-left                         \xf0`'
+    b'arrow-right                        \xf0a'
+    b'arrow-up                           \xf0b'
+    b'arrows-alt                         \xf0\xb2'
+    b'arrows-alt-h                       \xf37'
+    b'arrows-alt-v                       \xf38'
+    b'assistive-listening-systems        \xf2\xa2'
+    b'asterisk                           \xf0i'
+    b'asymmetrik                         \xf3r'
+    b'at                                 \xf1\xfa'
+    b'atlas                              \xf5X'
+    b'atom                               \xf5\xd2'
+    b'audible                            \xf3s'
+    b'audio-description                  \xf2\x9e'
+    b'autoprefixer                       \xf4\x1c'
+    b'avianex                            \xf3t'
+    b'aviato                             \xf4!'
+    b'award                              \xf5Y'
+    b'aws                                \xf3u'
+    b'backspace                          \xf5Z'
+    b'backward                           \xf0J'
+    b'balance-scale                      \xf2N'
+    b'ban                                \xf0^'
+    b'band-aid                           \xf4b'
+    b'bandcamp                           \xf2\xd5'
+    b'barcode                            \xf0*'
+    b'bars                               \xf0\xc9'
+    b'baseball-ball                      \xf43'
+    b'basketball-ball                    \xf44'
+    b'bath                               \xf2\xcd'
+    b'battery-empty                      \xf2D'
+    b'battery-full                       \xf2@'
+    b'battery-half                       \xf2B'
+    b'battery-quarter                    \xf2C'
+    b'battery-three-quarters             \xf2A'
+    b'bed                                \xf26'
+    b'beer                               \xf0\xfc'
+    b'behance                            \xf1\xb4'
+    b'behance-square                     \xf1\xb5'
+    b'bell                               \xf0\xf3'
+    b'bell-slash                         \xf1\xf6'
+    b'bezier-curve                       \xf5['
+    b'bible                              \xf6G'
+    b'bicycle                            \xf2\x06'
+    b'bimobject                          \xf3x'
+    b'binoculars                         \xf1\xe5'
+    b'birthday-cake                      \xf1\xfd'
+    b'bitbucket                          \xf1q'
+    b'bitcoin                            \xf3y'
+    b'bity                               \xf3z'
+    b'black-tie                          \xf2~'
+    b'blackberry                         \xf3{'
+    b'blender                            \xf5\x17'
+    b'blender-phone                      \xf6\xb6'
+    b'blind                              \xf2\x9d'
+    b'blogger                            \xf3|'
+    b'blogger-b                          \xf3}'
+    b'bluetooth                          \xf2\x93'
+    b'bluetooth-b                        \xf2\x94'
+    b'bold                               \xf02'
+    b'bolt                               \xf0\xe7'
+    b'bomb                               \xf1\xe2'
+    b'bone                               \xf5\xd7'
+    b'bong                               \xf5\\'
+    b'book                               \xf0-'
+    b'book-dead                          \xf6\xb7'
+    b'book-open                          \xf5\x18'
+    b'book-reader                        \xf5\xda'
+    b'bookmark                           \xf0.'
+    b'bowling-ball                       \xf46'
+    b'box                                \xf4f'
+    b'box-open                           \xf4\x9e'
+    b'boxes                              \xf4h'
+    b'braille                            \xf2\xa1'
+    b'brain                              \xf5\xdc'
+    b'briefcase                          \xf0\xb1'
+    b'briefcase-medical                  \xf4i'
+    b'broadcast-tower                    \xf5\x19'
+    b'broom                              \xf5\x1a'
+    b'brush                              \xf5]'
+    b'btc                                \xf1Z'
+    b'bug                                \xf1\x88'
+    b'building                           \xf1\xad'
+    b'bullhorn                           \xf0\xa1'
+    b'bullseye                           \xf1@'
+    b'burn                               \xf4j'
+    b'buromobelexperte                   \xf3\x7f'
+    b'bus                                \xf2\x07'
+    b'bus-alt                            \xf5^'
+    b'business-time                      \xf6J'
+    b'buysellads                         \xf2\r'
+    b'calculator                         \xf1\xec'
+    b'calendar                           \xf13'
+    b'calendar-alt                       \xf0s'
+    b'calendar-check                     \xf2t'
+    b'calendar-minus                     \xf2r'
+    b'calendar-plus                      \xf2q'
+    b'calendar-times                     \xf2s'
+    b'camera                             \xf00'
+    b'camera-retro                       \xf0\x83'
+    b'campground                         \xf6\xbb'
+    b'cannabis                           \xf5_'
+    b'capsules                           \xf4k'
+    b'car                                \xf1\xb9'
+    b'car-alt                            \xf5\xde'
+    b'car-battery                        \xf5\xdf'
+    b'car-crash                          \xf5\xe1'
+    b'car-side                           \xf5\xe4'
+    b'caret-down                         \xf0\xd7'
+    b'caret-left                         \xf0\xd9'
+    b'caret-right                        \xf0\xda'
+    b'caret-square-down                  \xf1P'
+    b'caret-square-left                  \xf1\x91'
+    b'caret-square-right                 \xf1R'
+    b'caret-square-up                    \xf1Q'
+    b'caret-up                           \xf0\xd8'
+    b'cart-arrow-down                    \xf2\x18'
+    b'cart-plus                          \xf2\x17'
+    b'cat                                \xf6\xbe'
+    b'cc-amazon-pay                      \xf4-'
+    b'cc-amex                            \xf1\xf3'
+    b'cc-apple-pay                       \xf4\x16'
+    b'cc-diners-club                     \xf2L'
+    b'cc-discover                        \xf1\xf2'
+    b'cc-jcb                             \xf2K'
+    b'cc-mastercard                      \xf1\xf1'
+    b'cc-paypal                          \xf1\xf4'
+    b'cc-stripe                          \xf1\xf5'
+    b'cc-visa                            \xf1\xf0'
+    b'centercode                         \xf3\x80'
+    b'certificate                        \xf0\xa3'
+    b'chair                              \xf6\xc0'
+    b'chalkboard                         \xf5\x1b'
+    b'chalkboard-teacher                 \xf5\x1c'
+    b'charging-station                   \xf5\xe7'
+    b'chart-area                         \xf1\xfe'
+    b'chart-bar                          \xf0\x80'
+    b'chart-line                         \xf2\x01'
+    b'chart-pie                          \xf2\x00'
+    b'check                              \xf0\x0c'
+    b'check-circle                       \xf0X'
+    b'check-double                       \xf5`'
+    b'check-square                       \xf1J'
+    b'chess                              \xf49'
+    b'chess-bishop                       \xf4:'
+    b'chess-board                        \xf4<'
+    b'chess-king                         \xf4?'
+    b'chess-knight                       \xf4A'
+    b'chess-pawn                         \xf4C'
+    b'chess-queen                        \xf4E'
+    b'chess-rook                         \xf4G'
+    b'chevron-circle-down                \xf1:'
+    b'chevron-circle-left                \xf17'
+    b'chevron-circle-right               \xf18'
+    b'chevron-circle-up                  \xf19'
+    b'chevron-down                       \xf0x'
+    b'chevron-left                       \xf0S'
+    b'chevron-right                      \xf0T'
+    b'chevron-up                         \xf0w'
+    b'child                              \xf1\xae'
+    b'chrome                             \xf2h'
+    b'church                             \xf5\x1d'
+    b'circle                             \xf1\x11'
+    b'circle-notch                       \xf1\xce'
+    b'city                               \xf6O'
+    b'clipboard                          \xf3('
+    b'clipboard-check                    \xf4l'
+    b'clipboard-list                     \xf4m'
+    b'clock                              \xf0\x17'
+    b'clone                              \xf2M'
+    b'closed-captioning                  \xf2\n'
+    b'cloud                              \xf0\xc2'
+    b'cloud-download-alt                 \xf3\x81'
+    b'cloud-meatball                     \xf7;'
+    b'cloud-moon                         \xf6\xc3'
+    b'cloud-moon-rain                    \xf7<'
+    b'cloud-rain                         \xf7='
+    b'cloud-showers-heavy                \xf7@'
+    b'cloud-sun                          \xf6\xc4'
+    b'cloud-sun-rain                     \xf7C'
+    b'cloud-upload-alt                   \xf3\x82'
+    b'cloudscale                         \xf3\x83'
+    b'cloudsmith                         \xf3\x84'
+    b'cloudversify                       \xf3\x85'
+    b'cocktail                           \xf5a'
+    b'code                               \xf1!'
+    b'code-branch                        \xf1&'
+    b'codepen                            \xf1\xcb'
+    b'codiepie                           \xf2\x84'
+    b'coffee                             \xf0\xf4'
+    b'cog                                \xf0\x13'
+    b'cogs                               \xf0\x85'
+    b'coins                              \xf5\x1e'
+    b'columns                            \xf0\xdb'
+    b'comment                            \xf0u'
+    b'comment-alt                        \xf2z'
+    b'comment-dollar                     \xf6Q'
+    b'comment-dots                       \xf4\xad'
+    b'comment-slash                      \xf4\xb3'
+    b'comments                           \xf0\x86'
+    b'comments-dollar                    \xf6S'
+    b'compact-disc                       \xf5\x1f'
+    b'compass                            \xf1N'
+    b'compress                           \xf0f'
+    b'concierge-bell                     \xf5b'
+    b'connectdevelop                     \xf2\x0e'
+    b'contao                             \xf2m'
+    b'cookie                             \xf5c'
+    b'cookie-bite                        \xf5d'
+    b'copy                               \xf0\xc5'
+    b'copyright                          \xf1\xf9'
+    b'couch                              \xf4\xb8'
+    b'cpanel                             \xf3\x88'
+    b'creative-commons                   \xf2^'
+    b'creative-commons-by                \xf4\xe7'
+    b'creative-commons-nc                \xf4\xe8'
+    b'creative-commons-nc-eu             \xf4\xe9'
+    b'creative-commons-nc-jp             \xf4\xea'
+    b'creative-commons-nd                \xf4\xeb'
+    b'creative-commons-pd                \xf4\xec'
+    b'creative-commons-pd-alt            \xf4\xed'
+    b'creative-commons-remix             \xf4\xee'
+    b'creative-commons-sa                \xf4\xef'
+    b'creative-commons-sampling          \xf4\xf0'
+    b'creative-commons-sampling-plus     \xf4\xf1'
+    b'creative-commons-share             \xf4\xf2'
+    b'creative-commons-zero              \xf4\xf3'
+    b'credit-card                        \xf0\x9d'
+    b'critical-role                      \xf6\xc9'
+    b'crop                               \xf1%'
+    b'crop-alt                           \xf5e'
+    b'cross                              \xf6T'
+    b'crosshairs                         \xf0['
+    b'crow                               \xf5 '
+    b'crown                              \xf5!'
+    b'css3                               \xf1<'
+    b'css3-alt                           \xf3\x8b'
+    b'cube                               \xf1\xb2'
+    b'cubes                              \xf1\xb3'
+    b'cut                                \xf0\xc4'
+    b'cuttlefish                         \xf3\x8c'
+    b'd-and-d                            \xf3\x8d'
+    b'd-and-d-beyond                     \xf6\xca'
+    b'dashcube                           \xf2\x10'
+    b'database                           \xf1\xc0'
+    b'deaf                               \xf2\xa4'
+    b'delicious                          \xf1\xa5'
+    b'democrat                           \xf7G'
+    b'deploydog                          \xf3\x8e'
+    b'deskpro                            \xf3\x8f'
+    b'desktop                            \xf1\x08'
+    b'dev                                \xf6\xcc'
+    b'deviantart                         \xf1\xbd'
+    b'dharmachakra                       \xf6U'
+    b'diagnoses                          \xf4p'
+    b'dice                               \xf5"'
+    b'dice-d20                           \xf6\xcf'
+    b'dice-d6                            \xf6\xd1'
+    b'dice-five                          \xf5#'
+    b'dice-four                          \xf5$'
+    b'dice-one                           \xf5%'
+    b'dice-six                           \xf5&'
+    b"dice-three                         \xf5'"
+    b'dice-two                           \xf5('
+    b'digg                               \xf1\xa6'
+    b'digital-ocean                      \xf3\x91'
+    b'digital-tachograph                 \xf5f'
+    b'directions                         \xf5\xeb'
+    b'discord                            \xf3\x92'
+    b'discourse                          \xf3\x93'
+    b'divide                             \xf5)'
+    b'dizzy                              \xf5g'
+    b'dna                                \xf4q'
+    b'dochub                             \xf3\x94'
+    b'docker                             \xf3\x95'
+    b'dog                                \xf6\xd3'
+    b'dollar-sign                        \xf1U'
+    b'dolly                              \xf4r'
+    b'dolly-flatbed                      \xf4t'
+    b'donate                             \xf4\xb9'
+    b'door-closed                        \xf5*'
+    b'door-open                          \xf5+'
+    b'dot-circle                         \xf1\x92'
+    b'dove                               \xf4\xba'
+    b'download                           \xf0\x19'
+    b'draft2digital                      \xf3\x96'
+    b'drafting-compass                   \xf5h'
+    b'dragon                             \xf6\xd5'
+    b'draw-polygon                       \xf5\xee'
+    b'dribbble                           \xf1}'
+    b'dribbble-square                    \xf3\x97'
+    b'dropbox                            \xf1k'
+    b'drum                               \xf5i'
+    b'drum-steelpan                      \xf5j'
+    b'drumstick-bite                     \xf6\xd7'
+    b'drupal                             \xf1\xa9'
+    b'dumbbell                           \xf4K'
+    b'dungeon                            \xf6\xd9'
+    b'dyalog                             \xf3\x99'
+    b'earlybirds                         \xf3\x9a'
+    b'ebay                               \xf4\xf4'
+    b'edge                               \xf2\x82'
+    b'edit                               \xf0D'
+    b'eject                              \xf0R'
+    b'elementor                          \xf40'
+    b'ellipsis-h                         \xf1A'
+    b'ellipsis-v                         \xf1B'
+    b'ello                               \xf5\xf1'
+    b'ember                              \xf4#'
+    b'empire                             \xf1\xd1'
+    b'envelope                           \xf0\xe0'
+    b'envelope-open                      \xf2\xb6'
+    b'envelope-open-text                 \xf6X'
+    b'envelope-square                    \xf1\x99'
+    b'envira                             \xf2\x99'
+    b'equals                             \xf5,'
+    b'eraser                             \xf1-'
+    b'erlang                             \xf3\x9d'
+    b'ethereum                           \xf4.'
+    b'etsy                               \xf2\xd7'
+    b'euro-sign                          \xf1S'
+    b'exchange-alt                       \xf3b'
+    b'exclamation                        \xf1*'
+    b'exclamation-circle                 \xf0j'
+    b'exclamation-triangle               \xf0q'
+    b'expand                             \xf0e'
+    b'expand-arrows-alt                  \xf3\x1e'
+    b'expeditedssl                       \xf2>'
+    b'external-link-alt                  \xf3]'
+    b'external-link-square-alt           \xf3`'
+    b'eye                                \xf0n'
+    b'eye-dropper                        \xf1\xfb'
+    b'eye-slash                          \xf0p'
+    b'facebook                           \xf0\x9a'
+    b'facebook-f                         \xf3\x9e'
+    b'facebook-messenger                 \xf3\x9f'
+    b'facebook-square                    \xf0\x82'
+    b'fantasy-flight-games               \xf6\xdc'
+    b'fast-backward                      \xf0I'
+    b'fast-forward                       \xf0P'
+    b'fax                                \xf1\xac'
+    b'feather                            \xf5-'
+    b'feather-alt                        \xf5k'
+    b'female                             \xf1\x82'
+    b'fighter-jet                        \xf0\xfb'
+    b'file                               \xf1['
+    b'file-alt                           \xf1\\'
+    b'file-archive                       \xf1\xc6'
+    b'file-audio                         \xf1\xc7'
+    b'file-code                          \xf1\xc9'
+    b'file-contract                      \xf5l'
+    b'file-csv                           \xf6\xdd'
+    b'file-download                      \xf5m'
+    b'file-excel                         \xf1\xc3'
+    b'file-export                        \xf5n'
+    b'file-image                         \xf1\xc5'
+    b'file-import                        \xf5o'
+    b'file-invoice                       \xf5p'
+    b'file-invoice-dollar                \xf5q'
+    b'file-medical                       \xf4w'
+    b'file-medical-alt                   \xf4x'
+    b'file-pdf                           \xf1\xc1'
+    b'file-powerpoint                    \xf1\xc4'
+    b'file-prescription                  \xf5r'
+    b'file-signature                     \xf5s'
+    b'file-upload                        \xf5t'
+    b'file-video                         \xf1\xc8'
+    b'file-word                          \xf1\xc2'
+    b'fill                               \xf5u'
+    b'fill-drip                          \xf5v'
+    b'film                               \xf0\x08'
+    b'filter                             \xf0\xb0'
+    b'fingerprint                        \xf5w'
+    b'fire                               \xf0m'
+    b'fire-extinguisher                  \xf14'
+    b'firefox                            \xf2i'
+    b'first-aid                          \xf4y'
+    b'first-order                        \xf2\xb0'
+    b'first-order-alt                    \xf5\n'
+    b'firstdraft                         \xf3\xa1'
+    b'fish                               \xf5x'
+    b'fist-raised                        \xf6\xde'
+    b'flag                               \xf0$'
+    b'flag-checkered                     \xf1\x1e'
+    b'flag-usa                           \xf7M'
+    b'flask                              \xf0\xc3'
+    b'flickr                             \xf1n'
+    b'flipboard                          \xf4M'
+    b'flushed                            \xf5y'
+    b'fly                                \xf4\x17'
+    b'folder                             \xf0{'
+    b'folder-minus                       \xf6]'
+    b'folder-open                        \xf0|'
+    b'folder-plus                        \xf6^'
+    b'font                               \xf01'
+    b'font-awesome                       \xf2\xb4'
+    b'font-awesome-alt                   \xf3\\'
+    b'font-awesome-flag                  \xf4%'
+    b'font-awesome-logo-full             \xf4\xe6'
+    b'fonticons                          \xf2\x80'
+    b'fonticons-fi                       \xf3\xa2'
+    b'football-ball                      \xf4N'
+    b'fort-awesome                       \xf2\x86'
+    b'fort-awesome-alt                   \xf3\xa3'
+    b'forumbee                           \xf2\x11'
+    b'forward                            \xf0N'
+    b'foursquare                         \xf1\x80'
+    b'free-code-camp                     \xf2\xc5'
+    b'freebsd                            \xf3\xa4'
+    b'frog                               \xf5.'
+    b'frown                              \xf1\x19'
+    b'frown-open                         \xf5z'
+    b'fulcrum                            \xf5\x0b'
+    b'funnel-dollar                      \xf6b'
+    b'futbol                             \xf1\xe3'
+    b'galactic-republic                  \xf5\x0c'
+    b'galactic-senate                    \xf5\r'
+    b'gamepad                            \xf1\x1b'
+    b'gas-pump                           \xf5/'
+    b'gavel                              \xf0\xe3'
+    b'gem                                \xf3\xa5'
+    b'genderless                         \xf2-'
+    b'get-pocket                         \xf2e'
+    b'gg                                 \xf2`'
+    b'gg-circle                          \xf2a'
+    b'ghost                              \xf6\xe2'
+    b'gift                               \xf0k'
+    b'git                                \xf1\xd3'
+    b'git-square                         \xf1\xd2'
+    b'github                             \xf0\x9b'
+    b'github-alt                         \xf1\x13'
+    b'github-square                      \xf0\x92'
+    b'gitkraken                          \xf3\xa6'
+    b'gitlab                             \xf2\x96'
+    b'gitter                             \xf4&'
+    b'glass-martini                      \xf0\x00'
+    b'glass-martini-alt                  \xf5{'
+    b'glasses                            \xf50'
+    b'glide                              \xf2\xa5'
+    b'glide-g                            \xf2\xa6'
+    b'globe                              \xf0\xac'
+    b'globe-africa                       \xf5|'
+    b'globe-americas                     \xf5}'
+    b'globe-asia                         \xf5~'
+    b'gofore                             \xf3\xa7'
+    b'golf-ball                          \xf4P'
+    b'goodreads                          \xf3\xa8'
+    b'goodreads-g                        \xf3\xa9'
+    b'google                             \xf1\xa0'
+    b'google-drive                       \xf3\xaa'
+    b'google-play                        \xf3\xab'
+    b'google-plus                        \xf2\xb3'
+    b'google-plus-g                      \xf0\xd5'
+    b'google-plus-square                 \xf0\xd4'
+    b'google-wallet                      \xf1\xee'
+    b'gopuram                            \xf6d'
+    b'graduation-cap                     \xf1\x9d'
+    b'gratipay                           \xf1\x84'
+    b'grav                               \xf2\xd6'
+    b'greater-than                       \xf51'
+    b'greater-than-equal                 \xf52'
+    b'grimace                            \xf5\x7f'
+    b'grin                               \xf5\x80'
+    b'grin-alt                           \xf5\x81'
+    b'grin-beam                          \xf5\x82'
+    b'grin-beam-sweat                    \xf5\x83'
+    b'grin-hearts                        \xf5\x84'
+    b'grin-squint                        \xf5\x85'
+    b'grin-squint-tears                  \xf5\x86'
+    b'grin-stars                         \xf5\x87'
+    b'grin-tears                         \xf5\x88'
+    b'grin-tongue                        \xf5\x89'
+    b'grin-tongue-squint                 \xf5\x8a'
+    b'grin-tongue-wink                   \xf5\x8b'
+    b'grin-wink                          \xf5\x8c'
+    b'grip-horizontal                    \xf5\x8d'
+    b'grip-vertical                      \xf5\x8e'
+    b'gripfire                           \xf3\xac'
+    b'grunt                              \xf3\xad'
+    b'gulp                               \xf3\xae'
+    b'h-square                           \xf0\xfd'
+    b'hacker-news                        \xf1\xd4'
+    b'hacker-news-square                 \xf3\xaf'
+    b'hackerrank                         \xf5\xf7'
+    b'hammer                             \xf6\xe3'
+    b'hamsa                              \xf6e'
+    b'hand-holding                       \xf4\xbd'
+    b'hand-holding-heart                 \xf4\xbe'
+    b'hand-holding-usd                   \xf4\xc0'
+    b'hand-lizard                        \xf2X'
+    b'hand-paper                         \xf2V'
+    b'hand-peace                         \xf2['
+    b'hand-point-down                    \xf0\xa7'
+    b'hand-point-left                    \xf0\xa5'
+    b'hand-point-right                   \xf0\xa4'
+    b'hand-point-up                      \xf0\xa6'
+    b'hand-pointer                       \xf2Z'
+    b'hand-rock                          \xf2U'
+    b'hand-scissors                      \xf2W'
+    b'hand-spock                         \xf2Y'
+    b'hands                              \xf4\xc2'
+    b'hands-helping                      \xf4\xc4'
+    b'handshake                          \xf2\xb5'
+    b'hanukiah                           \xf6\xe6'
+    b'hashtag                            \xf2\x92'
+    b'hat-wizard                         \xf6\xe8'
+    b'haykal                             \xf6f'
+    b'hdd                                \xf0\xa0'
+    b'heading                            \xf1\xdc'
+    b'headphones                         \xf0%'
+    b'headphones-alt                     \xf5\x8f'
+    b'headset                            \xf5\x90'
+    b'heart                              \xf0\x04'
+    b'heartbeat                          \xf2\x1e'
+    b'helicopter                         \xf53'
+    b'highlighter                        \xf5\x91'
+    b'hiking                             \xf6\xec'
+    b'hippo                              \xf6\xed'
+    b'hips                               \xf4R'
+    b'hire-a-helper                      \xf3\xb0'
+    b'history                            \xf1\xda'
+    b'hockey-puck                        \xf4S'
+    b'home                               \xf0\x15'
+    b"hooli                              \xf4'"
+    b'hornbill                           \xf5\x92'
+    b'horse                              \xf6\xf0'
+    b'hospital                           \xf0\xf8'
+    b'hospital-alt                       \xf4}'
+    b'hospital-symbol                    \xf4~'
+    b'hot-tub                            \xf5\x93'
+    b'hotel                              \xf5\x94'
+    b'hotjar                             \xf3\xb1'
+    b'hourglass                          \xf2T'
+    b'hourglass-end                      \xf2S'
+    b'hourglass-half                     \xf2R'
+    b'hourglass-start                    \xf2Q'
+    b'house-damage                       \xf6\xf1'
+    b'houzz                              \xf2|'
+    b'hryvnia                            \xf6\xf2'
+    b'html5                              \xf1;'
+    b'hubspot                            \xf3\xb2'
+    b'i-cursor                           \xf2F'
+    b'id-badge                           \xf2\xc1'
+    b'id-card                            \xf2\xc2'
+    b'id-card-alt                        \xf4\x7f'
+    b'image                              \xf0>'
+    b'images                             \xf3\x02'
+    b'imdb                               \xf2\xd8'
+    b'inbox                              \xf0\x1c'
+    b'indent                             \xf0<'
+    b'industry                           \xf2u'
+    b'infinity                           \xf54'
+    b'info                               \xf1)'
+    b'info-circle                        \xf0Z'
+    b'instagram                          \xf1m'
+    b'internet-explorer                  \xf2k'
+    b'ioxhost                            \xf2\x08'
+    b'italic                             \xf03'
+    b'itunes                             \xf3\xb4'
+    b'itunes-note                        \xf3\xb5'
+    b'java                               \xf4\xe4'
+    b'jedi                               \xf6i'
+    b'jedi-order                         \xf5\x0e'
+    b'jenkins                            \xf3\xb6'
+    b'joget                              \xf3\xb7'
+    b'joint                              \xf5\x95'
+    b'joomla                             \xf1\xaa'
+    b'journal-whills                     \xf6j'
+    b'js                                 \xf3\xb8'
+    b'js-square                          \xf3\xb9'
+    b'jsfiddle                           \xf1\xcc'
+    b'kaaba                              \xf6k'
+    b'kaggle                             \xf5\xfa'
+    b'key                                \xf0\x84'
+    b'keybase                            \xf4\xf5'
+    b'keyboard                           \xf1\x1c'
+    b'keycdn                             \xf3\xba'
+    b'khanda                             \xf6m'
+    b'kickstarter                        \xf3\xbb'
+    b'kickstarter-k                      \xf3\xbc'
+    b'kiss                               \xf5\x96'
+    b'kiss-beam                          \xf5\x97'
+    b'kiss-wink-heart                    \xf5\x98'
+    b'kiwi-bird                          \xf55'
+    b'korvue                             \xf4/'
+    b'landmark                           \xf6o'
+    b'language                           \xf1\xab'
+    b'laptop                             \xf1\t'
+    b'laptop-code                        \xf5\xfc'
+    b'laravel                            \xf3\xbd'
+    b'lastfm                             \xf2\x02'
+    b'lastfm-square                      \xf2\x03'
+    b'laugh                              \xf5\x99'
+    b'laugh-beam                         \xf5\x9a'
+    b'laugh-squint                       \xf5\x9b'
+    b'laugh-wink                         \xf5\x9c'
+    b'layer-group                        \xf5\xfd'
+    b'leaf                               \xf0l'
+    b'leanpub                            \xf2\x12'
+    b'lemon                              \xf0\x94'
+    b'less                               \xf4\x1d'
+    b'less-than                          \xf56'
+    b'less-than-equal                    \xf57'
+    b'level-down-alt                     \xf3\xbe'
+    b'level-up-alt                       \xf3\xbf'
+    b'life-ring                          \xf1\xcd'
+    b'lightbulb                          \xf0\xeb'
+    b'line                               \xf3\xc0'
+    b'link                               \xf0\xc1'
+    b'linkedin                           \xf0\x8c'
+    b'linkedin-in                        \xf0\xe1'
+    b'linode                             \xf2\xb8'
+    b'linux                              \xf1|'
+    b'lira-sign                          \xf1\x95'
+    b'list                               \xf0:'
+    b'list-alt                           \xf0"'
+    b'list-ol                            \xf0\xcb'
+    b'list-ul                            \xf0\xca'
+    b'location-arrow                     \xf1$'
+    b'lock                               \xf0#'
+    b'lock-open                          \xf3\xc1'
+    b'long-arrow-alt-down                \xf3\t'
+    b'long-arrow-alt-left                \xf3\n'
+    b'long-arrow-alt-right               \xf3\x0b'
+    b'long-arrow-alt-up                  \xf3\x0c'
+    b'low-vision                         \xf2\xa8'
+    b'luggage-cart                       \xf5\x9d'
+    b'lyft                               \xf3\xc3'
+    b'magento                            \xf3\xc4'
+    b'magic                              \xf0\xd0'
+    b'magnet                             \xf0v'
+    b'mail-bulk                          \xf6t'
+    b'mailchimp                          \xf5\x9e'
+    b'male                               \xf1\x83'
+    b'mandalorian                        \xf5\x0f'
+    b'map                                \xf2y'
+    b'map-marked                         \xf5\x9f'
+    b'map-marked-alt                     \xf5\xa0'
+    b'map-marker                         \xf0A'
+    b'map-marker-alt                     \xf3\xc5'
+    b'map-pin                            \xf2v'
+    b'map-signs                          \xf2w'
+    b'markdown                           \xf6\x0f'
+    b'marker                             \xf5\xa1'
+    b'mars                               \xf2"'
+    b"mars-double                        \xf2'"
+    b'mars-stroke                        \xf2)'
+    b'mars-stroke-h                      \xf2+'
+    b'mars-stroke-v                      \xf2*'
+    b'mask                               \xf6\xfa'
+    b'mastodon                           \xf4\xf6'
+    b'maxcdn                             \xf16'
+    b'medal                              \xf5\xa2'
+    b'medapps                            \xf3\xc6'
+    b'medium                             \xf2:'
+    b'medium-m                           \xf3\xc7'
+    b'medkit                             \xf0\xfa'
+    b'medrt                              \xf3\xc8'
+    b'meetup                             \xf2\xe0'
+    b'megaport                           \xf5\xa3'
+    b'meh                                \xf1\x1a'
+    b'meh-blank                          \xf5\xa4'
+    b'meh-rolling-eyes                   \xf5\xa5'
+    b'memory                             \xf58'
+    b'menorah                            \xf6v'
+    b'mercury                            \xf2#'
+    b'meteor                             \xf7S'
+    b'microchip                          \xf2\xdb'
+    b'microphone                         \xf10'
+    b'microphone-alt                     \xf3\xc9'
+    b'microphone-alt-slash               \xf59'
+    b'microphone-slash                   \xf11'
+    b'microscope                         \xf6\x10'
+    b'microsoft                          \xf3\xca'
+    b'minus                              \xf0h'
+    b'minus-circle                       \xf0V'
+    b'minus-square                       \xf1F'
+    b'mix                                \xf3\xcb'
+    b'mixcloud                           \xf2\x89'
+    b'mizuni                             \xf3\xcc'
+    b'mobile                             \xf1\x0b'
+    b'mobile-alt                         \xf3\xcd'
+    b'modx                               \xf2\x85'
+    b'monero                             \xf3\xd0'
+    b'money-bill                         \xf0\xd6'
+    b'money-bill-alt                     \xf3\xd1'
+    b'money-bill-wave                    \xf5:'
+    b'money-bill-wave-alt                \xf5;'
+    b'money-check                        \xf5<'
+    b'money-check-alt                    \xf5='
+    b'monument                           \xf5\xa6'
+    b'moon                               \xf1\x86'
+    b'mortar-pestle                      \xf5\xa7'
+    b'mosque                             \xf6x'
+    b'motorcycle                         \xf2\x1c'
+    b'mountain                           \xf6\xfc'
+    b'mouse-pointer                      \xf2E'
+    b'music                              \xf0\x01'
+    b'napster                            \xf3\xd2'
+    b'neos                               \xf6\x12'
+    b'network-wired                      \xf6\xff'
+    b'neuter                             \xf2,'
+    b'newspaper                          \xf1\xea'
+    b'nimblr                             \xf5\xa8'
+    b'nintendo-switch                    \xf4\x18'
+    b'node                               \xf4\x19'
+    b'node-js                            \xf3\xd3'
+    b'not-equal                          \xf5>'
+    b'notes-medical                      \xf4\x81'
+    b'npm                                \xf3\xd4'
+    b'ns8                                \xf3\xd5'
+    b'nutritionix                        \xf3\xd6'
+    b'object-group                       \xf2G'
+    b'object-ungroup                     \xf2H'
+    b'odnoklassniki                      \xf2c'
+    b'odnoklassniki-square               \xf2d'
+    b'oil-can                            \xf6\x13'
+    b'old-republic                       \xf5\x10'
+    b'om                                 \xf6y'
+    b'opencart                           \xf2='
+    b'openid                             \xf1\x9b'
+    b'opera                              \xf2j'
+    b'optin-monster                      \xf2<'
+    b'osi                                \xf4\x1a'
+    b'otter                              \xf7\x00'
+    b'outdent                            \xf0;'
+    b'page4                              \xf3\xd7'
+    b'pagelines                          \xf1\x8c'
+    b'paint-brush                        \xf1\xfc'
+    b'paint-roller                       \xf5\xaa'
+    b'palette                            \xf5?'
+    b'palfed                             \xf3\xd8'
+    b'pallet                             \xf4\x82'
+    b'paper-plane                        \xf1\xd8'
+    b'paperclip                          \xf0\xc6'
+    b'parachute-box                      \xf4\xcd'
+    b'paragraph                          \xf1\xdd'
+    b'parking                            \xf5@'
+    b'passport                           \xf5\xab'
+    b'pastafarianism                     \xf6{'
+    b'paste                              \xf0\xea'
+    b'patreon                            \xf3\xd9'
+    b'pause                              \xf0L'
+    b'pause-circle                       \xf2\x8b'
+    b'paw                                \xf1\xb0'
+    b'paypal                             \xf1\xed'
+    b'peace                              \xf6|'
+    b'pen                                \xf3\x04'
+    b'pen-alt                            \xf3\x05'
+    b'pen-fancy                          \xf5\xac'
+    b'pen-nib                            \xf5\xad'
+    b'pen-square                         \xf1K'
+    b'pencil-alt                         \xf3\x03'
+    b'pencil-ruler                       \xf5\xae'
+    b'penny-arcade                       \xf7\x04'
+    b'people-carry                       \xf4\xce'
+    b'percent                            \xf2\x95'
+    b'percentage                         \xf5A'
+    b'periscope                          \xf3\xda'
+    b'person-booth                       \xf7V'
+    b'phabricator                        \xf3\xdb'
+    b'phoenix-framework                  \xf3\xdc'
+    b'phoenix-squadron                   \xf5\x11'
+    b'phone                              \xf0\x95'
+    b'phone-slash                        \xf3\xdd'
+    b'phone-square                       \xf0\x98'
+    b'phone-volume                       \xf2\xa0'
+    b'php                                \xf4W'
+    b'pied-piper                         \xf2\xae'
+    b'pied-piper-alt                     \xf1\xa8'
+    b'pied-piper-hat                     \xf4\xe5'
+    b'pied-piper-pp                      \xf1\xa7'
+    b'piggy-bank                         \xf4\xd3'
+    b'pills                              \xf4\x84'
+    b'pinterest                          \xf0\xd2'
+    b'pinterest-p                        \xf21'
+    b'pinterest-square                   \xf0\xd3'
+    b'place-of-worship                   \xf6\x7f'
+    b'plane                              \xf0r'
+    b'plane-arrival                      \xf5\xaf'
+    b'plane-departure                    \xf5\xb0'
+    b'play                               \xf0K'
+    b'play-circle                        \xf1D'
+    b'playstation                        \xf3\xdf'
+    b'plug                               \xf1\xe6'
+    b'plus                               \xf0g'
+    b'plus-circle                        \xf0U'
+    b'plus-square                        \xf0\xfe'
+    b'podcast                            \xf2\xce'
+    b'poll                               \xf6\x81'
+    b'poll-h                             \xf6\x82'
+    b'poo                                \xf2\xfe'
+    b'poo-storm                          \xf7Z'
+    b'poop                               \xf6\x19'
+    b'portrait                           \xf3\xe0'
+    b'pound-sign                         \xf1T'
+    b'power-off                          \xf0\x11'
+    b'pray                               \xf6\x83'
+    b'praying-hands                      \xf6\x84'
+    b'prescription                       \xf5\xb1'
+    b'prescription-bottle                \xf4\x85'
+    b'prescription-bottle-alt            \xf4\x86'
+    b'print                              \xf0/'
+    b'procedures                         \xf4\x87'
+    b'product-hunt                       \xf2\x88'
+    b'project-diagram                    \xf5B'
+    b'pushed                             \xf3\xe1'
+    b'puzzle-piece                       \xf1.'
+    b'python                             \xf3\xe2'
+    b'qq                                 \xf1\xd6'
+    b'qrcode                             \xf0)'
+    b'question                           \xf1('
+    b'question-circle                    \xf0Y'
+    b'quidditch                          \xf4X'
+    b'quinscape                          \xf4Y'
+    b'quora                              \xf2\xc4'
+    b'quote-left                         \xf1\r'
+    b'quote-right                        \xf1\x0e'
+    b'quran                              \xf6\x87'
+    b'r-project                          \xf4\xf7'
+    b'rainbow                            \xf7['
+    b'random                             \xf0t'
+    b'ravelry                            \xf2\xd9'
+    b'react                              \xf4\x1b'
+    b'reacteurope                        \xf7]'
+    b'readme                             \xf4\xd5'
+    b'rebel                              \xf1\xd0'
+    b'receipt                            \xf5C'
+    b'recycle                            \xf1\xb8'
+    b'red-river                          \xf3\xe3'
+    b'reddit                             \xf1\xa1'
+    b'reddit-alien                       \xf2\x81'
+    b'reddit-square                      \xf1\xa2'
+    b'redo                               \xf0\x1e'
+    b'redo-alt                           \xf2\xf9'
+    b'registered                         \xf2]'
+    b'renren                             \xf1\x8b'
+    b'reply                              \xf3\xe5'
+    b'reply-all                          \xf1"'
+    b'replyd                             \xf3\xe6'
+    b'republican                         \xf7^'
+    b'researchgate                       \xf4\xf8'
+    b'resolving                          \xf3\xe7'
+    b'retweet                            \xf0y'
+    b'rev                                \xf5\xb2'
+    b'ribbon                             \xf4\xd6'
+    b'ring                               \xf7\x0b'
+    b'road                               \xf0\x18'
+    b'robot                              \xf5D'
+    b'rocket                             \xf15'
+    b'rocketchat                         \xf3\xe8'
+    b'rockrms                            \xf3\xe9'
+    b'route                              \xf4\xd7'
+    b'rss                                \xf0\x9e'
+    b'rss-square                         \xf1C'
+    b'ruble-sign                         \xf1X'
+    b'ruler                              \xf5E'
+    b'ruler-combined                     \xf5F'
+    b'ruler-horizontal                   \xf5G'
+    b'ruler-vertical                     \xf5H'
+    b'running                            \xf7\x0c'
+    b'rupee-sign                         \xf1V'
+    b'sad-cry                            \xf5\xb3'
+    b'sad-tear                           \xf5\xb4'
+    b'safari                             \xf2g'
+    b'sass                               \xf4\x1e'
+    b'save                               \xf0\xc7'
+    b'schlix                             \xf3\xea'
+    b'school                             \xf5I'
+    b'screwdriver                        \xf5J'
+    b'scribd                             \xf2\x8a'
+    b'scroll                             \xf7\x0e'
+    b'search                             \xf0\x02'
+    b'search-dollar                      \xf6\x88'
+    b'search-location                    \xf6\x89'
+    b'search-minus                       \xf0\x10'
+    b'search-plus                        \xf0\x0e'
+    b'searchengin                        \xf3\xeb'
+    b'seedling                           \xf4\xd8'
+    b'sellcast                           \xf2\xda'
+    b'sellsy                             \xf2\x13'
+    b'server                             \xf23'
+    b'servicestack                       \xf3\xec'
+    b'shapes                             \xf6\x1f'
+    b'share                              \xf0d'
+    b'share-alt                          \xf1\xe0'
+    b'share-alt-square                   \xf1\xe1'
+    b'share-square                       \xf1M'
+    b'shekel-sign                        \xf2\x0b'
+    b'shield-alt                         \xf3\xed'
+    b'ship                               \xf2\x1a'
+    b'shipping-fast                      \xf4\x8b'
+    b'shirtsinbulk                       \xf2\x14'
+    b'shoe-prints                        \xf5K'
+    b'shopping-bag                       \xf2\x90'
+    b'shopping-basket                    \xf2\x91'
+    b'shopping-cart                      \xf0z'
+    b'shopware                           \xf5\xb5'
+    b'shower                             \xf2\xcc'
+    b'shuttle-van                        \xf5\xb6'
+    b'sign                               \xf4\xd9'
+    b'sign-in-alt                        \xf2\xf6'
+    b'sign-language                      \xf2\xa7'
+    b'sign-out-alt                       \xf2\xf5'
+    b'signal                             \xf0\x12'
+    b'signature                          \xf5\xb7'
+    b'simplybuilt                        \xf2\x15'
+    b'sistrix                            \xf3\xee'
+    b'sitemap                            \xf0\xe8'
+    b'sith                               \xf5\x12'
+    b'skull                              \xf5L'
+    b'skull-crossbones                   \xf7\x14'
+    b'skyatlas                           \xf2\x16'
+    b'skype                              \xf1~'
+    b'slack                              \xf1\x98'
+    b'slack-hash                         \xf3\xef'
+    b'slash                              \xf7\x15'
+    b'sliders-h                          \xf1\xde'
+    b'slideshare                         \xf1\xe7'
+    b'smile                              \xf1\x18'
+    b'smile-beam                         \xf5\xb8'
+    b'smile-wink                         \xf4\xda'
+    b'smog                               \xf7_'
+    b'smoking                            \xf4\x8d'
+    b'smoking-ban                        \xf5M'
+    b'snapchat                           \xf2\xab'
+    b'snapchat-ghost                     \xf2\xac'
+    b'snapchat-square                    \xf2\xad'
+    b'snowflake                          \xf2\xdc'
+    b'socks                              \xf6\x96'
+    b'solar-panel                        \xf5\xba'
+    b'sort                               \xf0\xdc'
+    b'sort-alpha-down                    \xf1]'
+    b'sort-alpha-up                      \xf1^'
+    b'sort-amount-down                   \xf1`'
+    b'sort-amount-up                     \xf1a'
+    b'sort-down                          \xf0\xdd'
+    b'sort-numeric-down                  \xf1b'
+    b'sort-numeric-up                    \xf1c'
+    b'sort-up                            \xf0\xde'
+    b'soundcloud                         \xf1\xbe'
+    b'spa                                \xf5\xbb'
+    b'space-shuttle                      \xf1\x97'
+    b'speakap                            \xf3\xf3'
+    b'spider                             \xf7\x17'
+    b'spinner                            \xf1\x10'
+    b'splotch                            \xf5\xbc'
+    b'spotify                            \xf1\xbc'
+    b'spray-can                          \xf5\xbd'
+    b'square                             \xf0\xc8'
+    b'square-full                        \xf4\\'
+    b'square-root-alt                    \xf6\x98'
+    b'squarespace                        \xf5\xbe'
+    b'stack-exchange                     \xf1\x8d'
+    b'stack-overflow                     \xf1l'
+    b'stamp                              \xf5\xbf'
+    b'star                               \xf0\x05'
+    b'star-and-crescent                  \xf6\x99'
+    b'star-half                          \xf0\x89'
+    b'star-half-alt                      \xf5\xc0'
+    b'star-of-david                      \xf6\x9a'
+    b'star-of-life                       \xf6!'
+    b'staylinked                         \xf3\xf5'
+    b'steam                              \xf1\xb6'
+    b'steam-square                       \xf1\xb7'
+    b'steam-symbol                       \xf3\xf6'
+    b'step-backward                      \xf0H'
+    b'step-forward                       \xf0Q'
+    b'stethoscope                        \xf0\xf1'
+    b'sticker-mule                       \xf3\xf7'
+    b'sticky-note                        \xf2I'
+    b'stop                               \xf0M'
+    b'stop-circle                        \xf2\x8d'
+    b'stopwatch                          \xf2\xf2'
+    b'store                              \xf5N'
+    b'store-alt                          \xf5O'
+    b'strava                             \xf4('
+    b'stream                             \xf5P'
+    b'street-view                        \xf2\x1d'
+    b'strikethrough                      \xf0\xcc'
+    b'stripe                             \xf4)'
+    b'stripe-s                           \xf4*'
+    b'stroopwafel                        \xf5Q'
+    b'studiovinari                       \xf3\xf8'
+    b'stumbleupon                        \xf1\xa4'
+    b'stumbleupon-circle                 \xf1\xa3'
+    b'subscript                          \xf1,'
+    b'subway                             \xf29'
+    b'suitcase                           \xf0\xf2'
+    b'suitcase-rolling                   \xf5\xc1'
+    b'sun                                \xf1\x85'
+    b'superpowers                        \xf2\xdd'
+    b'superscript                        \xf1+'
+    b'supple                             \xf3\xf9'
+    b'surprise                           \xf5\xc2'
+    b'swatchbook                         \xf5\xc3'
+    b'swimmer                            \xf5\xc4'
+    b'swimming-pool                      \xf5\xc5'
+    b'synagogue                          \xf6\x9b'
+    b'sync                               \xf0!'
+    b'sync-alt                           \xf2\xf1'
+    b'syringe                            \xf4\x8e'
+    b'table                              \xf0\xce'
+    b'table-tennis                       \xf4]'
+    b'tablet                             \xf1\n'
+    b'tablet-alt                         \xf3\xfa'
+    b'tablets                            \xf4\x90'
+    b'tachometer-alt                     \xf3\xfd'
+    b'tag                                \xf0+'
+    b'tags                               \xf0,'
+    b'tape                               \xf4\xdb'
+    b'tasks                              \xf0\xae'
+    b'taxi                               \xf1\xba'
+    b'teamspeak                          \xf4\xf9'
+    b'teeth                              \xf6.'
+    b'teeth-open                         \xf6/'
+    b'telegram                           \xf2\xc6'
+    b'telegram-plane                     \xf3\xfe'
+    b'temperature-high                   \xf7i'
+    b'temperature-low                    \xf7k'
+    b'tencent-weibo                      \xf1\xd5'
+    b'terminal                           \xf1 '
+    b'text-height                        \xf04'
+    b'text-width                         \xf05'
+    b'th                                 \xf0\n'
+    b'th-large                           \xf0\t'
+    b'th-list                            \xf0\x0b'
+    b'the-red-yeti                       \xf6\x9d'
+    b'theater-masks                      \xf60'
+    b'themeco                            \xf5\xc6'
+    b'themeisle                          \xf2\xb2'
+    b'thermometer                        \xf4\x91'
+    b'thermometer-empty                  \xf2\xcb'
+    b'thermometer-full                   \xf2\xc7'
+    b'thermometer-half                   \xf2\xc9'
+    b'thermometer-quarter                \xf2\xca'
+    b'thermometer-three-quarters         \xf2\xc8'
+    b'think-peaks                        \xf71'
+    b'thumbs-down                        \xf1e'
+    b'thumbs-up                          \xf1d'
+    b'thumbtack                          \xf0\x8d'
+    b'ticket-alt                         \xf3\xff'
+    b'times                              \xf0\r'
+    b'times-circle                       \xf0W'
+    b'tint                               \xf0C'
+    b'tint-slash                         \xf5\xc7'
+    b'tired                              \xf5\xc8'
+    b'toggle-off                         \xf2\x04'
+    b'toggle-on                          \xf2\x05'
+    b'toilet-paper                       \xf7\x1e'
+    b'toolbox                            \xf5R'
+    b'tooth                              \xf5\xc9'
+    b'torah                              \xf6\xa0'
+    b'torii-gate                         \xf6\xa1'
+    b'tractor                            \xf7"'
+    b'trade-federation                   \xf5\x13'
+    b'trademark                          \xf2\\'
+    b'traffic-light                      \xf67'
+    b'train                              \xf28'
+    b'transgender                        \xf2$'
+    b'transgender-alt                    \xf2%'
+    b'trash                              \xf1\xf8'
+    b'trash-alt                          \xf2\xed'
+    b'tree                               \xf1\xbb'
+    b'trello                             \xf1\x81'
+    b'tripadvisor                        \xf2b'
+    b'trophy                             \xf0\x91'
+    b'truck                              \xf0\xd1'
+    b'truck-loading                      \xf4\xde'
+    b'truck-monster                      \xf6;'
+    b'truck-moving                       \xf4\xdf'
+    b'truck-pickup                       \xf6<'
+    b'tshirt                             \xf5S'
+    b'tty                                \xf1\xe4'
+    b'tumblr                             \xf1s'
+    b'tumblr-square                      \xf1t'
+    b'tv                                 \xf2l'
+    b'twitch                             \xf1\xe8'
+    b'twitter                            \xf0\x99'
+    b'twitter-square                     \xf0\x81'
+    b'typo3                              \xf4+'
+    b'uber                               \xf4\x02'
+    b'uikit                              \xf4\x03'
+    b'umbrella                           \xf0\xe9'
+    b'umbrella-beach                     \xf5\xca'
+    b'underline                          \xf0\xcd'
+    b'undo                               \xf0\xe2'
+    b'undo-alt                           \xf2\xea'
+    b'uniregistry                        \xf4\x04'
+    b'universal-access                   \xf2\x9a'
+    b'university                         \xf1\x9c'
+    b"unlink                             \xf1'"
+    b'unlock                             \xf0\x9c'
+    b'unlock-alt                         \xf1>'
+    b'untappd                            \xf4\x05'
+    b'upload                             \xf0\x93'
+    b'usb                                \xf2\x87'
+    b'user                               \xf0\x07'
+    b'user-alt                           \xf4\x06'
+    b'user-alt-slash                     \xf4\xfa'
+    b'user-astronaut                     \xf4\xfb'
+    b'user-check                         \xf4\xfc'
+    b'user-circle                        \xf2\xbd'
+    b'user-clock                         \xf4\xfd'
+    b'user-cog                           \xf4\xfe'
+    b'user-edit                          \xf4\xff'
+    b'user-friends                       \xf5\x00'
+    b'user-graduate                      \xf5\x01'
+    b'user-injured                       \xf7('
+    b'user-lock                          \xf5\x02'
+    b'user-md                            \xf0\xf0'
+    b'user-minus                         \xf5\x03'
+    b'user-ninja                         \xf5\x04'
+    b'user-plus                          \xf24'
+    b'user-secret                        \xf2\x1b'
+    b'user-shield                        \xf5\x05'
+    b'user-slash                         \xf5\x06'
+    b'user-tag                           \xf5\x07'
+    b'user-tie                           \xf5\x08'
+    b'user-times                         \xf25'
+    b'users                              \xf0\xc0'
+    b'users-cog                          \xf5\t'
+    b'ussunnah                           \xf4\x07'
+    b'utensil-spoon                      \xf2\xe5'
+    b'utensils                           \xf2\xe7'
+    b'vaadin                             \xf4\x08'
+    b'vector-square                      \xf5\xcb'
+    b'venus                              \xf2!'
+    b'venus-double                       \xf2&'
+    b'venus-mars                         \xf2('
+    b'viacoin                            \xf27'
+    b'viadeo                             \xf2\xa9'
+    b'viadeo-square                      \xf2\xaa'
+    b'vial                               \xf4\x92'
+    b'vials                              \xf4\x93'
+    b'viber                              \xf4\t'
+    b'video                              \xf0='
+    b'video-slash                        \xf4\xe2'
+    b'vihara                             \xf6\xa7'
+    b'vimeo                              \xf4\n'
+    b'vimeo-square                       \xf1\x94'
+    b'vimeo-v                            \xf2}'
+    b'vine                               \xf1\xca'
+    b'vk                                 \xf1\x89'
+    b'vnv                                \xf4\x0b'
+    b'volleyball-ball                    \xf4_'
+    b"volume-down                        \xf0'"
+    b'volume-mute                        \xf6\xa9'
+    b'volume-off                         \xf0&'
+    b'volume-up                          \xf0('
+    b'vote-yea                           \xf7r'
+    b'vr-cardboard                       \xf7)'
+    b'vuejs                              \xf4\x1f'
+    b'walking                            \xf5T'
+    b'wallet                             \xf5U'
+    b'warehouse                          \xf4\x94'
+    b'water                              \xf7s'
+    b'weebly                             \xf5\xcc'
+    b'weibo                              \xf1\x8a'
+    b'weight                             \xf4\x96'
+    b'weight-hanging                     \xf5\xcd'
+    b'weixin                             \xf1\xd7'
+    b'whatsapp                           \xf22'
+    b'whatsapp-square                    \xf4\x0c'
+    b'wheelchair                         \xf1\x93'
+    b'whmcs                              \xf4\r'
+    b'wifi                               \xf1\xeb'
+    b'wikipedia-w                        \xf2f'
+    b'wind                               \xf7.'
+    b'window-close                       \xf4\x10'
+    b'window-maximize                    \xf2\xd0'
+    b'window-minimize                    \xf2\xd1'
+    b'window-restore                     \xf2\xd2'
+    b'windows                            \xf1z'
+    b'wine-bottle                        \xf7/'
+    b'wine-glass                         \xf4\xe3'
+    b'wine-glass-alt                     \xf5\xce'
+    b'wix                                \xf5\xcf'
+    b'wizards-of-the-coast               \xf70'
+    b'wolf-pack-battalion                \xf5\x14'
+    b'won-sign                           \xf1Y'
+    b'wordpress                          \xf1\x9a'
+    b'wordpress-simple                   \xf4\x11'
+    b'wpbeginner                         \xf2\x97'
+    b'wpexplorer                         \xf2\xde'
+    b'wpforms                            \xf2\x98'
+    b'wpressr                            \xf3\xe4'
+    b'wrench                             \xf0\xad'
+    b'x-ray                              \xf4\x97'
+    b'xbox                               \xf4\x12'
+    b'xing                               \xf1h'
+    b'xing-square                        \xf1i'
+    b'y-combinator                       \xf2;'
+    b'yahoo                              \xf1\x9e'
+    b'yandex                             \xf4\x13'
+    b'yandex-international               \xf4\x14'
+    b'yelp                               \xf1\xe9'
+    b'yen-sign                           \xf1W'
+    b'yin-yang                           \xf6\xad'
+    b'yoast                              \xf2\xb1'
+    b'youtube                            \xf1g'
+    b'youtube-square                     \xf41'
+)
@@ -1,12 +1,27 @@
 #!/usr/bin/env python3
 """Dynamically update i3wm workspace names based on running applications in each and optionally define an icon to show instead."""
 
+import hashlib
 import json
+import marshal
+import math
+import queue
 import os.path
 import argparse
+import bisect
+import contextlib
 import re
+import signal
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, OrderedDict, namedtuple
 import i3ipc
-from fa_icons import icons
+import fa_icons_table
+from fa_icons_table import lookup as lookup_icon
+# asyncio and socketserver are slow to import and only needed with some options, they're imported
+# where they're used so the daemon is quick to (re)start, see --startup-timing
 
 I3_CONFIG_PATHS = tuple(os.path.expanduser(path) for path in ("~/.i3", "~/.config/i3", "~/.config/i3-regolith"))
 
@@ -22,85 +37,1905 @@ DEFAULT_APP_ICON_CONFIG = {
     "signal": "comment"
 }
 
+# bump when the layout of the on-disk rule cache changes
+RULE_CACHE_VERSION = 2
 
-def build_rename(i3, app_icons, args):
-    """Build rename callback function to pass to i3ipc.
+# bump when the layout of the label snapshot, or how labels are computed, changes
+SNAPSHOT_VERSION = 2
+
+# events that can change the windows in a workspace, or the workspaces themselves
+RENAME_EVENTS = ('window::move', 'window::new', 'window::title', 'window::close', 'window::floating',
+                 'workspace', 'output')
+
+# window identifiers rules are matched against, in order, and the attribute of a leaf holding each of them
+RULE_IDENTIFIERS = OrderedDict((('name', 'name'), ('title', 'window_title'), ('instance', 'window_instance'),
+                                ('class', 'window_class')))
+
+# upper bound on the size of a single `command` request, larger batches of renames are split
+MAX_COMMAND_BYTES = 16 * 1024
+
+# once matching a window identifier takes longer than this, its rules are matched one at a time and the time
+# each regex rule takes in matches this slow is charged to its budget, see --rule-budget-ms
+SLOW_MATCH = 0.001
+# rules matched one at a time go back to being matched together after this many fast matches in a row, and
+# the time charged to them is forgiven
+FAST_MATCHES = 100
+
+# lengths of the adversarial titles every rule is timed against by --lint-config
+LINT_TITLE_LENGTHS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+# a single match taking longer than this is reported as catastrophic by --lint-config, and interrupted
+LINT_MATCH_LIMIT = 0.1
+# matches faster than this on the longest titles are too noisy to tell how their time grows
+LINT_NOISE_FLOOR = 20e-6
+# titles like those of browsers and terminals, every rule is timed against them besides the adversarial ones
+LINT_TITLES = (
+    'Pull request #1234: Speed up matching of window titles against app-icon rules by rule-index lookups '
+    '· cboddy/i3-workspace-names-daemon - Mozilla Firefox',
+    'user@host: ~/src/i3-workspace-names-daemon/benchmarks — vim bench_rename.py fake_i3.py startup_budget.py',
+    'https://www.example.com/search?q=i3wm+workspace+names+daemon+font+awesome+icons&source=hp&ei=abcdefghij'
+    '&iflsig=0123456789abcdef&oq=i3wm&gs_lcp=Cgdnd3Mtd2l6EAMyBQgAEIAE - Google Chrome',
+    '[Untitled-1] (imported)-1.0 (RGB color 8-bit gamma integer, GIMP built-in sRGB, 1 layer) 3840x2160 – GIMP',
+    '~',
+)
+
+# patterns that refer to their own groups by number or name, these can't be joined into one alternation
+_GROUP_REFERENCE_RE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
+# patterns without any special characters (other than escaped punctuation), optionally anchored at the end
+_LITERAL_RE = re.compile(r'\^?((?:[^.^$*+?{}\[\]\\|()]|\\[^0-9A-Za-z])*)(\$?)\Z')
+
+# case-folds ASCII the way re.IGNORECASE compares it, including the few non-ASCII characters it
+# considers equal to an ASCII letter (eg. the Kelvin sign and 'k'), depending on the Python version
+_ASCII_FOLD = {c: c + 32 for c in range(ord('A'), ord('Z') + 1)}
+_ASCII_FOLD.update((ord(c), letter) for c, letter in (('\u0130', 'i'), ('\u0131', 'i'), ('\u017f', 's'), ('\u212a', 'k'))
+                   if re.match(letter, c, re.IGNORECASE))
+
+
+def _literal_rule(name_re):
+    """Get the text of an application-name regex that is a plain ASCII string, and whether it is anchored
+    at the end (ie. matches the name exactly) rather than matching any name it is a prefix of, or None."""
+    m = _LITERAL_RE.match(name_re)
+    if m is None or not name_re.isascii():
+        return None
+    return re.sub(r'\\(.)', r'\1', m.group(1)).translate(_ASCII_FOLD), bool(m.group(2))
+
+
+class _RuleSet:
+    """The rules that apply to one window identifier, indexed for finding the first one that matches.
+
+    Regexes that are plain names (matching any name they are a prefix of) or plain names anchored with `$`
+    are looked up in case-folded indexes. Where possible the remaining rules are joined into a single
+    alternation so that the first matching rule, in config order, is found in one pass over the name.
 
     Parameters
     ----------
-    i3: `i3ipc.i3ipc.Connection`
-    app_icons: `dict[str, str]`
-        Index of application-name regex (from i3) to icon-name (in font-awesome gallery).
-    delim: `str`
-        Delimiter to use when build workspace name from app names/icons.
+    resolved: `list[(str, str)]`
+        Application-name regex and glyph of each rule, in config order.
+    groups: `list[int]`
+        Number of groups in each regex.
+    """
 
-    Returns
-    -------
-    func
-        The rename callback.
+    def __init__(self, resolved, groups):
+        self.resolved = resolved
+        # case-folded text of the literal rules -> index of the first rule with that text
+        self._exact = {}
+        self._prefixes = {}
+        # indexes of the rules that need the regex engine
+        self._regex_rules = []
+        for i, (name_re, _) in enumerate(resolved):
+            literal = _literal_rule(name_re)
+            if literal is None:
+                self._regex_rules.append(i)
+            else:
+                text, exact = literal
+                (self._exact if exact else self._prefixes).setdefault(text, i)
+        self._prefix_lengths = sorted({len(text) for text in self._prefixes})
+
+        regexes = [resolved[i][0] for i in self._regex_rules]
+        self._patterns = None
+        self._combined = None
+        self._group_rules = {}
+        if regexes and not any(groups[i] and _GROUP_REFERENCE_RE.search(resolved[i][0]) for i in self._regex_rules):
+            parts = []
+            group = 1
+            for i in self._regex_rules:
+                # wrap each rule in its own group, the outermost group that matched is always `lastindex`
+                parts.append(u"({})".format(resolved[i][0]))
+                self._group_rules[group] = i
+                group += groups[i] + 1
+            try:
+                self._combined = re.compile(u"|".join(parts), re.IGNORECASE)
+            except re.error:
+                # eg. inline flags that are only valid at the start of a pattern
+                self._combined = None
+        if self._combined is None:
+            self._patterns = [re.compile(name_re, re.IGNORECASE) for name_re in regexes]
+
+    def __len__(self):
+        return len(self.resolved)
+
+    def match(self, name, timed=None):
+        """Get the glyph of the first rule matching `name`, or None.
+
+        When `timed` is a list, the rules that need the regex engine are matched one at a time rather than
+        as one alternation, and the application-name regex of each one tried is appended to it with the
+        seconds it took.
+        """
+        first = None
+        if self._exact or self._prefixes:
+            folded = name.translate(_ASCII_FOLD)
+            # like re.match, `$` also matches before a trailing newline
+            first = self._exact.get(folded)
+            if folded.endswith('\n'):
+                i = self._exact.get(folded[:-1])
+                if i is not None and (first is None or i < first):
+                    first = i
+            for length in self._prefix_lengths:
+                if length > len(folded):
+                    break
+                i = self._prefixes.get(folded[:length])
+                if i is not None and (first is None or i < first):
+                    first = i
+            if first is not None and (not self._regex_rules or first < self._regex_rules[0]):
+                # no regex rule comes before the literal that matched
+                return self.resolved[first][1]
+        if timed is not None:
+            if self._patterns is None:
+                self._patterns = [re.compile(self.resolved[i][0], re.IGNORECASE) for i in self._regex_rules]
+            for i, pattern in zip(self._regex_rules, self._patterns):
+                if first is not None and i > first:
+                    break
+                start = time.perf_counter()
+                m = pattern.match(name)
+                timed.append((self.resolved[i][0], time.perf_counter() - start))
+                if m:
+                    first = i
+                    break
+        elif self._combined is not None:
+            m = self._combined.match(name)
+            if m and (first is None or self._group_rules[m.lastindex] < first):
+                first = self._group_rules[m.lastindex]
+        elif self._patterns:
+            for i, pattern in zip(self._regex_rules, self._patterns):
+                if first is not None and i > first:
+                    break
+                if pattern.match(name):
+                    first = i
+                    break
+        return self.resolved[first][1] if first is not None else None
+
+
+def _parse_rule(app, value):
+    """Get the icon-name of an app-icon config entry and the identifiers it applies to (None for all of them).
+
+    Raises
+    ------
+    ValueError
+        When the entry is neither an icon-name nor an object with an "icon" and optionally the identifiers to "match".
+    """
+    if isinstance(value, str):
+        return value, None
+    if not isinstance(value, dict) or not isinstance(value.get('icon'), str):
+        raise ValueError("App-icon config entry for '{}' must be an icon-name or an object with an 'icon'".format(app))
+    targets = value.get('match')
+    if targets is None:
+        return value['icon'], None
+    if isinstance(targets, str):
+        targets = [targets]
+    if not isinstance(targets, list):
+        raise ValueError("'match' for '{}' must be an identifier or a list of them".format(app))
+    unknown = [t for t in targets if t not in RULE_IDENTIFIERS]
+    if unknown:
+        raise ValueError("Unknown window identifier {} for '{}', expected some of {}".format(
+            ', '.join(map(repr, unknown)), app, ', '.join(RULE_IDENTIFIERS)))
+    return value['icon'], [t for t in RULE_IDENTIFIERS if t in targets]
+
+
+class AppIconRules:
+    """Compiled form of an app-icon mapping.
+
+    Every application-name regex is compiled once and its icon-name is resolved to a glyph ahead of time.
+    The rules are indexed separately for each window identifier, see `_RuleSet`, identifiers that the
+    same rules apply to share one index.
+
+    Parameters
+    ----------
+    app_icons: `dict[str, str|dict]`
+        Index of application-name regex (from i3) to icon-name (in font-awesome gallery), or to an object
+        with the icon-name as "icon" and the identifiers the regex is matched against as "match"
+        (some of "name", "title", "instance" and "class", all of them by default).
+
+    Raises
+    ------
+    re.error
+        When an application-name is not a valid regex.
+    ValueError
+        When an entry has an unknown format or identifier.
+    """
+
+    def __init__(self, app_icons):
+        rules = [(name_re,) + _parse_rule(name_re, value) for name_re, value in app_icons.items()]
+        # rules with an unknown icon can never match, so drop them up-front
+        glyphs = [(name_re, lookup_icon(icon_name), targets) for name_re, icon_name, targets in rules]
+        glyphs = [rule for rule in glyphs if rule[1] is not None]
+        no_match = app_icons.get("_no_match")
+        self._compile([(name_re, glyph) for name_re, glyph, _ in glyphs],
+                      lookup_icon(_parse_rule("_no_match", no_match)[0]) if no_match is not None else None,
+                      targets=[targets for _, _, targets in glyphs])
+
+    @classmethod
+    def from_resolved(cls, resolved, no_match, groups=None, targets=None):
+        """Build the rules from application-name regexes whose icons are already resolved to glyphs.
+
+        Parameters
+        ----------
+        resolved: `list[(str, str)]`
+            Application-name regex and glyph of each rule, in config order, see `AppIconRules.resolved`.
+        no_match: `str|None`
+            Glyph to show for windows no rule matches.
+        groups: `list[int]|None`
+            Number of groups in each regex, see `AppIconRules.groups`. When given the regexes are
+            trusted to be valid and are only compiled when they can't be joined into one alternation.
+        targets: `list[list[str]|None]|None`
+            Identifiers each rule applies to, see `AppIconRules.targets`, all of them by default.
+        """
+        rules = cls.__new__(cls)
+        rules._compile(resolved, no_match, groups, targets)
+        return rules
+
+    def _compile(self, resolved, no_match, groups=None, targets=None):
+        self.resolved = [(name_re, glyph) for name_re, glyph in resolved]
+        self.no_match = no_match
+        self.targets = list(targets) if targets is not None else [None] * len(self.resolved)
+        if groups is None:
+            # literal rules are valid regexes without any groups, compile the rest to check them
+            groups = [0 if _literal_rule(name_re) else re.compile(name_re, re.IGNORECASE).groups
+                      for name_re, _ in self.resolved]
+        self.groups = list(groups)
+
+        self._rule_sets = {}
+        shared = {}
+        for identifier in RULE_IDENTIFIERS:
+            indexes = tuple(i for i, t in enumerate(self.targets) if t is None or identifier in t)
+            if indexes not in shared:
+                shared[indexes] = _RuleSet([self.resolved[i] for i in indexes], [self.groups[i] for i in indexes])
+            self._rule_sets[identifier] = shared[indexes]
+
+    def without(self, name_res):
+        """Get a copy of the rules without those whose application-name regex is in `name_res`."""
+        keep = [i for i, (name_re, _) in enumerate(self.resolved) if name_re not in name_res]
+        return AppIconRules.from_resolved([self.resolved[i] for i in keep], self.no_match,
+                                          [self.groups[i] for i in keep], [self.targets[i] for i in keep])
+
+    def rule_set(self, identifier):
+        """Get the rules that apply to a window identifier, one of `RULE_IDENTIFIERS`."""
+        return self._rule_sets[identifier]
+
+    def match(self, name, identifier='name'):
+        """Get the glyph of the first rule matching `name`.
+
+        Parameters
+        ----------
+        name: `str`
+            Window name, title, instance or class.
+        identifier: `str`
+            Which of those `name` is, one of `RULE_IDENTIFIERS`.
+
+        Returns
+        -------
+        str|None
+            The glyph for the first matching rule or None if no rule matches.
+        """
+        return self._rule_sets[identifier].match(name)
+
+
+Leaf = namedtuple('Leaf', ('id', 'name', 'window_title', 'window_instance', 'window_class'))
+
+
+def _leaf_from_con(con):
+    return Leaf(con.id, con.name, con.window_title, con.window_instance, con.window_class)
+
+
+def _identifiers_digest(leaf):
+    """Digest of the identifiers of a leaf (not its id), so that they can be compared without keeping titles around."""
+    return hashlib.sha256(json.dumps(leaf[1:]).encode('utf-8')).digest()[:16]
+
+
+def _con_output(con):
+    # i3 includes the output in the data of every container, older versions only in the tree itself
+    output = con.ipc_data.get('output')
+    while output is None and con is not None:
+        if con.type == 'output':
+            return con.name
+        con = con.parent
+    return output
+
+
+class Workspace:
+    """A workspace and the leaves (windows) within it, in the order i3 reports them."""
+
+    def __init__(self, id, name, num, leaves, output=None):
+        self.id = id
+        self.name = name
+        self.num = num
+        self.leaves = leaves
+        self.output = output
+
+
+class WorkspaceModel:
+    """In-memory view of the workspaces and their leaves, kept up to date from i3 events.
+
+    The model is built from a full tree with `sync` and then updated with `apply` from the payload
+    of each event. Events whose effect can't be worked out from their payload (eg. the target of a
+    `window::move`) mark the model as `stale`, in which case it should be synced again before use.
+
+    Workspaces whose name may have changed are collected in `dirty` until taken with `take_dirty`,
+    the id of the focused workspace is kept in `focused`.
+
+    When `visible` is set, dirty workspaces that aren't shown on any output are held back in `deferred`
+    by `take_dirty`, until they're shown, focused or `undefer` is called.
+    """
+
+    def __init__(self):
+        self.workspaces = {}
+        self.dirty = {}
+        self.deferred = {}
+        self.focused = None
+        # ids of the workspaces shown on an output, or None to not defer any workspace
+        self.visible = None
+        self._leaf_workspace = {}
+        self._renaming = {}
+        self.stale = True
+
+    def sync(self, tree):
+        """Rebuild the model from a full tree.
+
+        Parameters
+        ----------
+        tree: `i3ipc.Con`
+            The root container, as returned by `i3ipc.Connection.get_tree`.
+        """
+        old = self.workspaces
+        self.workspaces = {}
+        self._leaf_workspace = {}
+        for con in tree.workspaces():
+            leaves = [_leaf_from_con(leaf) for leaf in con.leaves()]
+            workspace = Workspace(con.id, con.name, con.num, leaves, _con_output(con))
+            self.workspaces[con.id] = workspace
+            for leaf in leaves:
+                self._leaf_workspace[leaf.id] = con.id
+            # only workspaces that differ from what the events told us need to be looked at again
+            previous = old.get(con.id)
+            if previous is None or previous.leaves != leaves or previous.name != con.name \
+               or previous.num != con.num:
+                self.dirty[con.id] = None
+        self.deferred = {i: None for i in self.deferred if i in self.workspaces}
+        if self.visible is not None:
+            # the workspace shown on an output is the first one in the focus order of its content container
+            self.visible = {con.id for con in tree.workspaces()
+                            if con.parent is not None and (con.parent.focus or [None])[0] == con.id}
+            self.undefer([i for i in self.deferred if i in self.visible])
+        focused = tree.find_focused()
+        workspace = focused.workspace() if focused is not None else None
+        self.focused = workspace.id if workspace is not None else None
+        self.stale = False
+
+    def take_dirty(self, defer=True):
+        """Get the workspaces whose name may need to change, and reset the dirty set.
+
+        Parameters
+        ----------
+        defer: `bool`
+            Hold back workspaces that aren't `visible`.
+
+        Returns
+        -------
+        list[Workspace]
+        """
+        dirty = [self.workspaces[i] for i in self.dirty if i in self.workspaces]
+        self.dirty = {}
+        if self.visible is None or not defer:
+            return dirty
+        current = []
+        for workspace in dirty:
+            if workspace.id in self.visible or workspace.id == self.focused:
+                current.append(workspace)
+            else:
+                self.deferred[workspace.id] = None
+        return current
+
+    def undefer(self, workspace_ids=None):
+        """Mark deferred workspaces (all of them by default) as dirty again."""
+        for i in list(self.deferred) if workspace_ids is None else workspace_ids:
+            if self.deferred.pop(i, False) is None:
+                self.dirty[i] = None
+
+    def relevant(self, event):
+        """Whether `apply` may ask for a rename for `event`, without applying it.
+
+        Only reads the model, so it can be called from the thread reading events while another one applies them,
+        eg. to tell whether a newer event supersedes a rename pass in progress. Echoes of our own renames aren't.
+        """
+        if isinstance(event, i3ipc.WindowEvent):
+            return True
+        if not isinstance(event, i3ipc.WorkspaceEvent):
+            # output changes
+            return self.visible is not None
+        con = event.current
+        if con is None or con.name.startswith('__'):
+            return False
+        if event.change == 'rename':
+            return con.name not in self._renaming.get(con.id, ())
+        if event.change == 'focus':
+            return con.id in self.deferred
+        if event.change == 'move':
+            return self.visible is not None
+        return event.change in ('init', 'reload', 'restored')
+
+    def leaf(self, con_id):
+        """Get the leaf with the given container id, or None."""
+        workspace_id = self._leaf_workspace.get(con_id)
+        if workspace_id is None:
+            return None
+        return next((leaf for leaf in self.workspaces[workspace_id].leaves if leaf.id == con_id), None)
+
+    def replace_leaf(self, leaf):
+        """Replace the leaf with the same container id, without marking its workspace dirty."""
+        leaves = self.workspaces[self._leaf_workspace[leaf.id]].leaves
+        for i, old in enumerate(leaves):
+            if old.id == leaf.id:
+                leaves[i] = leaf
+                break
+
+    def expect_rename(self, workspace_id, name):
+        """Record that we're about to rename a workspace, so its workspace::rename event is known to be ours."""
+        # events arrive on a different socket than command replies, so the workspace::rename
+        # event for this may turn up before the reply or only after later renames have been applied.
+        self._renaming.setdefault(workspace_id, []).append(name)
+
+    def rename(self, workspace_id, name):
+        """Record that a workspace has been renamed by us."""
+        workspace = self.workspaces.get(workspace_id)
+        if workspace is not None:
+            workspace.name = name
+
+    def rename_failed(self, workspace_id, name):
+        """Forget a rename of ours that i3 didn't apply, the model has to be synced again."""
+        renaming = self._renaming.get(workspace_id, [])
+        if name in renaming:
+            renaming.remove(name)
+        self.stale = True
+
+    def apply(self, event):
+        """Update the model from an i3 event.
+
+        Parameters
+        ----------
+        event: `i3ipc.IpcBaseEvent`
+
+        Returns
+        -------
+        bool
+            True if workspace names may need to be updated as a result of the event.
+        """
+        if isinstance(event, i3ipc.WindowEvent):
+            return self._apply_window(event.change, event.container)
+        if isinstance(event, i3ipc.WorkspaceEvent):
+            return self._apply_workspace(event.change, event.current)
+        # output changes can move workspaces around, pick them up on the next sync
+        self.stale = True
+        # and show deferred workspaces
+        return self.visible is not None
+
+    def _apply_window(self, change, con):
+        workspace_id = self._leaf_workspace.get(con.id)
+        if change == 'title':
+            if workspace_id is None:
+                self.stale = True
+                return True
+            self.replace_leaf(_leaf_from_con(con))
+            self.dirty[workspace_id] = None
+            return True
+        if change == 'close':
+            if workspace_id is None:
+                return False
+            del self._leaf_workspace[con.id]
+            workspace = self.workspaces[workspace_id]
+            workspace.leaves = [leaf for leaf in workspace.leaves if leaf.id != con.id]
+            self.dirty[workspace_id] = None
+            return True
+        # the event doesn't say where the window ended up (new, move, floating)
+        self.stale = True
+        return True
+
+    def _apply_workspace(self, change, con):
+        if con is None or con.name.startswith('__'):
+            return False
+        if change == 'init':
+            self.workspaces[con.id] = Workspace(con.id, con.name, con.num, [], con.ipc_data.get('output'))
+            self.dirty[con.id] = None
+            return True
+        if change == 'empty':
+            self._renaming.pop(con.id, None)
+            self.deferred.pop(con.id, None)
+            if self.visible is not None:
+                self.visible.discard(con.id)
+            workspace = self.workspaces.pop(con.id, None)
+            for leaf in workspace.leaves if workspace is not None else ():
+                self._leaf_workspace.pop(leaf.id, None)
+            return False
+        if change == 'rename':
+            renaming = self._renaming.get(con.id, ())
+            if con.name in renaming:
+                # our own rename, the model already has it (or a later one)
+                del renaming[:renaming.index(con.name) + 1]
+                return False
+            # renamed by the user, eg. `rename workspace to 7`, its windows have to be added to the new name
+            if con.id not in self.workspaces:
+                self.stale = True
+            else:
+                self.workspaces[con.id].name = con.name
+                self.workspaces[con.id].num = con.num
+                self.dirty[con.id] = None
+            return True
+        if change in ('reload', 'restored'):
+            self.stale = True
+            return True
+        if change == 'focus':
+            # tracked from the events so that nothing has to ask i3 for the focused workspace
+            self.focused = con.id
+            if self.visible is not None:
+                self._show(con)
+            if con.id in self.deferred:
+                self.undefer([con.id])
+                return True
+        if change == 'move' and self.visible is not None:
+            # the workspace went to another output, where it may be shown, and another one shown in its place
+            self.stale = True
+            return True
+        return False
+
+    def _show(self, con):
+        # the focused workspace is shown in place of the one shown on its output until now
+        workspace = self.workspaces.get(con.id)
+        output = con.ipc_data.get('output') or (workspace.output if workspace is not None else None)
+        if output is None:
+            self.stale = True
+            return
+        if workspace is not None:
+            workspace.output = output
+        self.visible = {i for i in self.visible if i in self.workspaces and self.workspaces[i].output != output}
+        self.visible.add(con.id)
+
+
+class LabelCache:
+    """Least-recently-used cache of the label computed for each window.
+
+    Entries are keyed by the window's container id and only hit while the window's identifiers
+    (name, title, instance and class) are unchanged.
+
+    Parameters
+    ----------
+    maxsize: `int`
+        Maximum number of windows to keep labels for.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, leaf):
+        """Get the cached label for `leaf` or None."""
+        entry = self._entries.get(leaf.id)
+        if entry is None or entry[0] != leaf:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(leaf.id)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, leaf, label):
+        self._entries[leaf.id] = (leaf, label)
+        self._entries.move_to_end(leaf.id)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, con_id):
+        self._entries.pop(con_id, None)
+
+    def items(self):
+        """Get the (leaf, label) pairs, least recently used first."""
+        return list(self._entries.values())
+
+    def clear(self):
+        self._entries.clear()
+
+
+class PhaseTimings:
+    """Cumulative number of calls and time spent in each phase of the rename pipeline.
+
+    The phases are fetching the tree (`get_tree`), working out the name/icon of windows
+    (`match`), building the rename commands from them (`build`) and the `command` round trip.
+    """
+
+    PHASES = ('get_tree', 'match', 'build', 'command')
+
+    def __init__(self):
+        self.calls = Counter()
+        self.seconds = Counter()
+
+    def add(self, phase, seconds):
+        self.calls[phase] += 1
+        self.seconds[phase] += seconds
+
+    def report(self):
+        """Format the timings as a table, one phase per line."""
+        lines = ['{:<10} {:>10} {:>12} {:>12}'.format('phase', 'calls', 'total_ms', 'mean_us')]
+        for phase in self.PHASES:
+            calls, seconds = self.calls[phase], self.seconds[phase]
+            lines.append('{:<10} {:>10} {:>12.3f} {:>12.1f}'.format(
+                phase, calls, seconds * 1000, seconds / calls * 1e6 if calls else 0.0))
+        return '\n'.join(lines)
+
+    def as_dict(self):
+        return {phase: {'calls': self.calls[phase], 'seconds': self.seconds[phase]} for phase in self.PHASES}
+
+
+class LatencyHistogram:
+    """Number of latencies that fall into each of a fixed set of buckets.
+
+    Bucket `b` counts the latencies greater than the previous bucket's bound and at most `b`
+    milliseconds, the last bucket counts everything above the largest bound.
+    """
+
+    BOUNDS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.sum_ms = 0.0
+
+    def add(self, seconds):
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.sum_ms += ms
+
+    def as_dict(self):
+        buckets = OrderedDict(('{:g}'.format(bound), n) for bound, n in zip(self.BOUNDS_MS, self.counts))
+        buckets['+Inf'] = self.counts[-1]
+        return {'count': sum(self.counts), 'sum_ms': self.sum_ms, 'buckets_ms': buckets}
+
+
+class RenameStats:
+    """Counters of what the daemon has been doing, as served by `StatsServer`."""
+
+    def __init__(self):
+        self.started = time.time()
+        # events received, by type and change, eg. 'window::title'
+        self.events = Counter()
+        # events handled by the same rename pass as an earlier event
+        self.coalesced = 0
+        # window::title events that couldn't change the label of their window
+        self.titles_dropped = 0
+        self.passes = 0
+        # passes whose commands were dropped for newer events
+        self.superseded = 0
+        self.renames = 0
+        self.failed_renames = 0
+        self.bytes_sent = 0
+        # from receiving an event to i3 acknowledging the command it led to
+        self.latency = LatencyHistogram()
+
+    def add_events(self, events):
+        for e in events:
+            if isinstance(e, i3ipc.WindowEvent):
+                self.events['window::' + e.change] += 1
+            elif isinstance(e, i3ipc.WorkspaceEvent):
+                self.events['workspace::' + e.change] += 1
+            else:
+                self.events['output'] += 1
+        self.coalesced += max(len(events) - 1, 0)
+
+    def add_command(self, payload, replies, received):
+        self.bytes_sent += len(payload.encode('utf-8'))
+        acked = time.monotonic()
+        for t in received:
+            self.latency.add(acked - t)
+        for reply in replies or ():
+            if reply.success:
+                self.renames += 1
+            else:
+                self.failed_renames += 1
+
+
+class StatsServer:
+    """Serve the daemon's stats as JSON on a Unix socket.
+
+    Each connection gets one JSON document and is closed, eg. `socat - UNIX-CONNECT:<path>`.
+    The socket is served from a background thread.
+
+    Parameters
+    ----------
+    path: `str`
+        Path of the Unix socket, an existing socket at that path is replaced.
+    renamer: `WorkspaceRenamer`
     """
-    delim = args.delimiter
-    length = args.max_title_length
-    uniq = args.uniq
-    no_match_show_name = not args.no_match_not_show_name
-    verbose = args.verbose
 
-    def get_icon_or_name(leaf, length):
-        for identifier in ('name', 'window_title', 'window_instance', 'window_class'):
-            name = getattr(leaf, identifier, None)
+    def __init__(self, path, renamer):
+        import socketserver
+        import stat
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                self.request.sendall(json.dumps(self.server.renamer.stats_dict()).encode('utf-8') + b'\n')
+
+        if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+        self.path = path
+        self.server = socketserver.UnixStreamServer(path, Handler)
+        self.server.renamer = renamer
+        os.chmod(path, 0o600)
+        thread = threading.Thread(target=self.server.serve_forever, name='stats-server', daemon=True)
+        thread.start()
+
+
+class WorkspaceRenamer:
+    """Rename callback that keeps workspace names in sync with the windows in them.
+
+    Instances are callable with the signature i3ipc expects from an event handler, `rename_events`
+    handles several events at once with a single tree fetch and a single command.
+
+    Parameters
+    ----------
+    rules: `AppIconRules`
+    args: `argparse.Namespace`
+        Parsed command line options.
+    """
+
+    def __init__(self, rules, args):
+        self.rules = rules
+        self.delim = args.delimiter
+        self.length = args.max_title_length
+        self.uniq = args.uniq
+        self.no_match_show_name = not args.no_match_not_show_name
+        self.verbose = args.verbose
+        # only this many characters of an identifier are matched against the rules, all of them when 0
+        self.match_length = args.max_match_length
+        # seconds a regex rule may spend in a spell of slow matches (see `SLOW_MATCH`) before it's quarantined,
+        # 0 for no limit
+        self.rule_budget = args.rule_budget_ms / 1000
+        self.rule_seconds = Counter()
+        self.quarantined = set()
+        # rule sets that had a slow match -> fast matches since the last slow one, they're matched rule by rule
+        # until `FAST_MATCHES` of them so that the time of the slow ones can be attributed
+        self._timed_rule_sets = {}
+        self.model = WorkspaceModel()
+        self.labels = LabelCache(args.label_cache_size)
+        # requests sent to i3, by type
+        self.ipc_calls = Counter()
+        self.timings = PhaseTimings()
+        self.stats = RenameStats()
+        # workspace id -> name last sent to i3 for it, until i3 has acknowledged it
+        self.in_flight = {}
+        # a `CommandSender` to hand commands to, they're sent from the rename pass itself when None
+        self.sender = None
+        if args.output_scoped:
+            # only rename the workspaces that are shown straight away, see `WorkspaceModel.deferred`
+            self.model.visible = set()
+        # called with the connection and None once workspaces were deferred, eg. a `Coalescer`
+        # that calls `rename_deferred`, they're only renamed once relevant when None
+        self.deferred_pass = None
+        self._defer = True
+        # a `cProfile.Profile` to enable during rename passes, see `_toggle_profiler`
+        self.profiler = None
+        # `_identifiers_digest` -> label, from the snapshot of a previous run, until the initial pass is done
+        self._warm_labels = {}
+        # rename passes can be started from the event, coalescer and config-watcher threads
+        self._lock = threading.RLock()
+
+    def __call__(self, i3, e):
+        self.rename_events(i3, [e])
+
+    def get_icon_or_name(self, leaf, length):
+        tried = []
+        for identifier, attribute in RULE_IDENTIFIERS.items():
+            name = getattr(leaf, attribute, None)
             if name is None:
                 continue
-            for name_re in app_icons.keys():
-                if re.match(name_re, name, re.IGNORECASE) \
-                   and app_icons[name_re] in icons:
-                    return icons[app_icons[name_re]]
+            rule_set = self.rules.rule_set(identifier)
+            # name and title are usually the same string, there's no need to match it against the same rules twice
+            if (rule_set, name) in tried:
+                continue
+            tried.append((rule_set, name))
+            matched = name[:self.match_length] if self.match_length else name
+            timed = [] if rule_set in self._timed_rule_sets else None
+            start = time.perf_counter()
+            glyph = rule_set.match(matched, timed)
+            if self.rule_budget and time.perf_counter() - start > SLOW_MATCH:
+                # the time of a combined match can't be told apart, the next ones can
+                self._timed_rule_sets[rule_set] = 0
+                if timed is not None:
+                    self._charge_rules(timed)
+            elif timed is not None:
+                self._timed_rule_sets[rule_set] += 1
+                if self._timed_rule_sets[rule_set] >= FAST_MATCHES:
+                    # the slow spell is over, eg. a title that was slow to match went away
+                    del self._timed_rule_sets[rule_set]
+                    for name_re, _ in rule_set.resolved:
+                        self.rule_seconds.pop(name_re, None)
+            if glyph is not None:
+                return glyph
         if name:
-            if "_no_match" in app_icons and app_icons["_no_match"] in icons:
-                return icons[app_icons["_no_match"]] + ('{}'.format(name) if no_match_show_name else '')
+            if self.rules.no_match is not None:
+                return self.rules.no_match + ('{}'.format(name) if self.no_match_show_name else '')
             return name[:length]
         else:
             # no identifiable information about this window
             return '?'
 
-    def rename(i3, e):
-        workspaces = i3.get_tree().workspaces()
-        # need to use get_workspaces since the i3 con object doesn't have the visible property for some reason
-        workdicts = i3.get_workspaces()
-        visible = [workdict.name for workdict in workdicts if workdict.visible]
-        visworkspaces = []
-        focus = ([workdict.name for workdict in workdicts if workdict.focused] or [None])[0]
-        focusname = None
+    def _charge_rules(self, timed):
+        """Add the time each regex rule took in a slow match, see `_RuleSet.match`, to its total, and quarantine
+        the rules that went over budget, they're left out of the rules from now on."""
+        over = []
+        for name_re, seconds in timed:
+            self.rule_seconds[name_re] += seconds
+            if self.rule_seconds[name_re] > self.rule_budget:
+                over.append(name_re)
+        if over:
+            for name_re in over:
+                print("App-icon rule '{}' spent {:.0f}ms matching windows, over its budget of {:.0f}ms. "
+                      "Ignoring it until the config is reloaded, see --lint-config.".format(
+                          name_re, self.rule_seconds[name_re] * 1000, self.rule_budget * 1000))
+            self.quarantined.update(over)
+            self.rules = self.rules.without(over)
+            # the rules left start a new spell, matched together again
+            for name_re in list(self.rule_seconds):
+                if name_re not in self.quarantined:
+                    del self.rule_seconds[name_re]
+            self._timed_rule_sets.clear()
+
+    def get_label(self, leaf):
+        label = self.labels.get(leaf)
+        if label is None:
+            # container ids change when i3 restarts, the label only depends on the identifiers
+            label = self._warm_labels.get(_identifiers_digest(leaf)) if self._warm_labels else None
+            if label is None:
+                start = time.perf_counter()
+                label = self.get_icon_or_name(leaf, self.length)
+                self.timings.add('match', time.perf_counter() - start)
+            self.labels.put(leaf, label)
+        return label
+
+    def apply_events(self, events):
+        """Update the model from a batch of events.
+
+        Parameters
+        ----------
+        events: `list[i3ipc.IpcBaseEvent]`
+
+        Returns
+        -------
+        bool
+            True if a rename pass is needed, in which case the tree has to be synced first when `model.stale`.
+        """
+        self.stats.add_events(events)
+        rename = False
+        # apply every event, the model has to see all of them even once one of them asks for a rename.
+        for e in events:
+            if isinstance(e, i3ipc.WindowEvent):
+                if e.change == 'title' and self._keeps_label(e.container):
+                    self.stats.titles_dropped += 1
+                    continue
+                if e.change == 'close':
+                    self.labels.invalidate(e.container.id)
+            rename = self.model.apply(e) or rename
+        return rename or bool(self.model.dirty)
 
+    def _keeps_label(self, con):
+        """Check from the payload of a window::title event whether the window's label stays the same,
+        in which case the model and label cache are updated without marking the workspace dirty."""
+        old = self.model.leaf(con.id)
+        label = self.labels.get(old) if old is not None else None
+        if label is None:
+            return False
+        leaf = _leaf_from_con(con)
+        # the label only depends on the name and title through rules matching them
+        if self.rules.rule_set('name') or self.rules.rule_set('title'):
+            start = time.perf_counter()
+            new_label = self.get_icon_or_name(leaf, self.length)
+            self.timings.add('match', time.perf_counter() - start)
+            # either way only this leaf needs its label worked out
+            self.labels.put(leaf, new_label)
+            if new_label != label:
+                return False
+        else:
+            self.labels.put(leaf, label)
+        self.model.replace_leaf(leaf)
+        return True
+
+    def set_rules(self, rules):
+        """Swap in new app-icon rules, every workspace is renamed on the next pass.
+
+        Parameters
+        ----------
+        rules: `AppIconRules`
+        """
+        with self._lock:
+            self.rules = rules
+            # every rule gets a fresh budget
+            self.rule_seconds.clear()
+            self.quarantined.clear()
+            self._timed_rule_sets.clear()
+            self.labels.clear()
+            self.model.dirty.update(dict.fromkeys(self.model.workspaces))
+
+    def build_commands(self):
+        """Build the rename commands for every dirty workspace.
+
+        Returns
+        -------
+        (list[str], list[(int, str)])
+            The commands and the (workspace id, new name) each of them applies.
+        """
+        start = time.perf_counter()
+        matching = self.timings.seconds['match']
         commands = []
-        for workspace in workspaces:
-            names = [get_icon_or_name(leaf, length)
-                     for leaf in workspace.leaves()]
-            if uniq:
+        renamed = []
+        dirty = self.model.take_dirty(self._defer)
+        self._defer = True
+        for workspace in dirty:
+            names = [self.get_label(leaf) for leaf in workspace.leaves]
+            if self.uniq:
                 seen = set()
                 names = [x for x in names if x not in seen and not seen.add(x)]
-            names = delim.join(names)
+            names = self.delim.join(names)
             if int(workspace.num) >= 0:
                 newname = u"{}: {}".format(workspace.num, names)
             else:
                 newname = names
 
-            if workspace.name in visible:
-                visworkspaces.append(newname)
-            if workspace.name == focus:
-                focusname = newname
-
-            if workspace.name != newname:
+            # the tree may have been fetched before the last rename sent for this workspace got to i3
+            current = self.in_flight.get(workspace.id, workspace.name)
+            if current != newname:
                 commands.append('rename workspace "{}" to "{}"'.format(
                     # escape any double quotes in old or new name.
-                    workspace.name.replace('"', '\\"'), newname.replace('"', '\\"')))
-                if verbose:
+                    current.replace('"', '\\"'), newname.replace('"', '\\"')))
+                renamed.append((workspace.id, newname))
+                if self.verbose:
                     print(commands[-1])
+        # time spent matching windows is accounted for separately
+        self.timings.add('build', time.perf_counter() - start - (self.timings.seconds['match'] - matching))
+        return commands, renamed
+
+    def record_replies(self, renamed, replies):
+        """Record the new names straight away rather than waiting for the workspace::rename events,
+        so that events already queued behind them don't try to rename from the old name."""
+        replies = list(replies or ())
+        for i, (workspace_id, newname) in enumerate(renamed):
+            if self.in_flight.get(workspace_id) == newname:
+                del self.in_flight[workspace_id]
+            # i3 stops at a command it can't parse, the ones after it get no reply
+            if i < len(replies) and replies[i].success:
+                self.model.rename(workspace_id, newname)
+            else:
+                self.model.rename_failed(workspace_id, newname)
+
+    def queue_commands(self, commands, renamed, received):
+        """Mark renames as in flight and split them into requests of at most `MAX_COMMAND_BYTES`.
+
+        Parameters
+        ----------
+        commands: `list[str]`
+        renamed: `list[(int, str)]`
+            See `build_commands`.
+        received: `list[float]`
+            See `rename_events`, only the last request counts towards the event-to-ack latency.
+
+        Returns
+        -------
+        list[(str, list[(int, str)], list[float])]
+            The arguments of `send_command` for each request, to be sent in order.
+        """
+        for workspace_id, newname in renamed:
+            self.in_flight[workspace_id] = newname
+            self.model.expect_rename(workspace_id, newname)
+        requests = []
+        start = size = 0
+        for end, command in enumerate(commands):
+            size += len(command.encode('utf-8')) + 1
+            if size > MAX_COMMAND_BYTES and end > start:
+                requests.append((u';'.join(commands[start:end]), renamed[start:end], []))
+                start, size = end, len(command.encode('utf-8')) + 1
+        requests.append((u';'.join(commands[start:]), renamed[start:], received))
+        return requests
+
+    def send_command(self, i3, payload, renamed, received):
+        """Send one request from `queue_commands` and record i3's replies to it."""
+        start = time.perf_counter()
+        try:
+            replies = i3.command(payload)
+        except Exception:
+            with self._lock:
+                self.record_replies(renamed, None)
+            raise
+        with self._lock:
+            self.record_command(payload, renamed, replies, received, time.perf_counter() - start)
+
+    async def send_command_async(self, i3, payload, renamed, received):
+        """Same as `send_command` for an `i3ipc.aio.Connection`."""
+        start = time.perf_counter()
+        try:
+            replies = await i3.command(payload)
+        except Exception:
+            self.record_replies(renamed, None)
+            raise
+        self.record_command(payload, renamed, replies, received, time.perf_counter() - start)
+
+    def record_command(self, payload, renamed, replies, received, seconds):
+        self.ipc_calls['command'] += 1
+        self.timings.add('command', seconds)
+        self.stats.add_command(payload, replies, received)
+        self.record_replies(renamed, replies)
+
+    def rename_events(self, i3, events, received=None, superseded=None):
+        """Update workspace names for a batch of events.
+
+        Parameters
+        ----------
+        i3: `i3ipc.i3ipc.Connection`
+        events: `list[i3ipc.IpcBaseEvent]`
+        received: `list[float]|None`
+            `time.monotonic()` at which each of the events was received, defaults to now.
+        superseded: `func|None`
+            Returns True when newer events are waiting and the commands built from an outdated view should be
+            left to the next pass, eg. `Coalescer.superseded` when called from that coalescer's callback.
+        """
+        if received is None:
+            received = [time.monotonic()] * len(events)
+        with self._lock, self._profiling():
+            if self.apply_events(events):
+                self._rename_pass(i3, received, superseded)
+
+    def _rename_pass(self, i3, received, superseded=None):
+        self.stats.passes += 1
+        if self.model.stale:
+            self.ipc_calls['get_tree'] += 1
+            start = time.perf_counter()
+            self.model.sync(i3.get_tree())
+            self.timings.add('get_tree', time.perf_counter() - start)
+
+        commands, renamed = self.build_commands()
+        if commands and superseded is not None and superseded():
+            self.stats.superseded += 1
+            self.model.dirty.update(dict.fromkeys(workspace_id for workspace_id, _ in renamed))
+            commands = []
+        if commands:
+            # we have to send all the activate workspaces commands in one go, in order, or the order
+            # might get scrambled by multiple i3-msg instances running asyncronously
+            # causing the wrong workspace to be activated last, which changes the focus.
+            # `sender` sends requests one at a time from a single thread, so they stay in order.
+            for request in self.queue_commands(commands, renamed, received):
+                if self.sender is not None:
+                    self.sender(i3, *request)
+                else:
+                    self.send_command(i3, *request)
+        if self.model.deferred and self.deferred_pass is not None:
+            self.deferred_pass(i3, None)
+        self._print_stats()
+
+    def rename_all(self, i3):
+        """Rename every workspace from a freshly fetched tree, eg. at startup.
+
+        Only the workspaces whose name differs from what it should be are renamed. Labels of windows
+        are taken from the snapshot passed to `warm` where possible, which is dropped afterwards.
+        """
+        with self._lock, self._profiling():
+            self._start_full_pass()
+            self._rename_pass(i3, [])
+            self._warm_labels = {}
+
+    def _start_full_pass(self):
+        self.model.stale = True
+        self.model.dirty.update(dict.fromkeys(self.model.workspaces))
+
+    def reload(self, i3, rules):
+        """Swap in new app-icon rules and rename every workspace with them."""
+        with self._lock:
+            self.set_rules(rules)
+            self.rename_events(i3, [])
+
+    def undefer(self):
+        """Have the next rename pass include the workspaces deferred as they're not shown."""
+        with self._lock:
+            self.model.undefer()
+            self._defer = False
+
+    def rename_deferred(self, i3):
+        """Bring the workspaces deferred as they're not shown up to date."""
+        with self._lock:
+            if self.model.deferred:
+                self.undefer()
+                self.rename_events(i3, [])
+
+    async def rename_events_async(self, i3, events, received=None):
+        """Same as `rename_events` for an `i3ipc.aio.Connection`."""
+        if received is None:
+            received = [time.monotonic()] * len(events)
+        # only held against the stats server thread, everything else runs on the event loop
+        with self._lock, self._profiling():
+            if self.apply_events(events):
+                await self._rename_pass_async(i3, received)
+
+    async def _rename_pass_async(self, i3, received):
+        self.stats.passes += 1
+        if self.model.stale:
+            self.ipc_calls['get_tree'] += 1
+            start = time.perf_counter()
+            self.model.sync(await i3.get_tree())
+            self.timings.add('get_tree', time.perf_counter() - start)
+        commands, renamed = self.build_commands()
+        if commands:
+            for request in self.queue_commands(commands, renamed, received):
+                await self.send_command_async(i3, *request)
+        if self.model.deferred and self.deferred_pass is not None:
+            self.deferred_pass(i3, None)
+        self._print_stats()
+
+    async def rename_all_async(self, i3):
+        """Same as `rename_all` for an `i3ipc.aio.Connection`."""
+        with self._lock, self._profiling():
+            self._start_full_pass()
+            await self._rename_pass_async(i3, [])
+            self._warm_labels = {}
+
+    def name_tree(self, tree):
+        """Work out the name of every workspace in a tree, without connecting to i3, see --from-tree.
+
+        Parameters
+        ----------
+        tree: `i3ipc.Con`
+            The root container, eg. parsed from the output of `i3-msg -t get_tree`.
+
+        Returns
+        -------
+        (list[str], OrderedDict[str, str])
+            The commands that would rename the workspaces, and the name each workspace would get by its current name.
+        """
+        with self._lock:
+            self.model = WorkspaceModel()
+            self.in_flight = {}
+            self.model.sync(tree)
+            commands, renamed = self.build_commands()
+            names = dict(renamed)
+            return commands, OrderedDict((workspace.name, names.get(workspace.id, workspace.name))
+                                         for workspace in self.model.workspaces.values())
+
+    def snapshot_key(self):
+        """Key of the rules and options labels depend on, a snapshot is only used by a renamer with the same key."""
+        settings = (SNAPSHOT_VERSION, self.rules.resolved, self.rules.targets, self.rules.no_match, self.length,
+                    self.no_match_show_name, self.match_length)
+        # not marshal, its output depends on which of the objects are shared
+        return hashlib.sha256(json.dumps(settings).encode('utf-8')).hexdigest()
+
+    def snapshot(self):
+        """Get the labels of the windows in the label cache, to `warm` the renamer of a later run with.
+
+        Returns
+        -------
+        dict
+            The `snapshot_key` and the (`_identifiers_digest`, label) pairs, marshal-able. Window titles are
+            only kept as digests, they can contain URLs, mail subjects and the like.
+        """
+        with self._lock:
+            return {'key': self.snapshot_key(),
+                    'labels': [(_identifiers_digest(leaf), label) for leaf, label in self.labels.items()]}
+
+    def warm(self, snapshot):
+        """Reuse the labels of a `snapshot` from a previous run in the next `rename_all`, if its key matches."""
+        if snapshot is not None and snapshot.get('key') == self.snapshot_key():
+            self._warm_labels = dict(snapshot['labels'])
+
+    @contextlib.contextmanager
+    def _profiling(self):
+        profiler = self.profiler
+        if profiler is None:
+            yield
+            return
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+
+    def stats_dict(self):
+        """Everything `StatsServer` reports, as a JSON-serialisable dict."""
+        with self._lock:
+            stats = self.stats
+            lookups = self.labels.hits + self.labels.misses
+            return {
+                'pid': os.getpid(),
+                'uptime_s': time.time() - stats.started,
+                'events': dict(stats.events),
+                'events_coalesced': stats.coalesced,
+                'title_events_dropped': stats.titles_dropped,
+                'rename_passes': stats.passes,
+                'superseded_passes': stats.superseded,
+                'renames': stats.renames,
+                'failed_renames': stats.failed_renames,
+                'commands': self.ipc_calls['command'],
+                'get_tree_calls': self.ipc_calls['get_tree'],
+                'bytes_sent': stats.bytes_sent,
+                'quarantined_rules': sorted(self.quarantined),
+                'label_cache': {'hits': self.labels.hits, 'misses': self.labels.misses, 'windows': len(self.labels),
+                                'hit_rate': self.labels.hits / lookups if lookups else None},
+                # 'match' is the time spent in get_icon_or_name
+                'timings': self.timings.as_dict(),
+                'event_to_ack_latency': self.stats.latency.as_dict(),
+            }
+
+    def _print_stats(self):
+        if self.verbose:
+            print('label cache: {} hits, {} misses, {} windows; ipc calls: {}'.format(
+                self.labels.hits, self.labels.misses, len(self.labels),
+                ', '.join('{} {}'.format(n, request) for request, n in sorted(self.ipc_calls.items()))))
+
+
+class Coalescer:
+    """Collapse bursts of events into a single call of a batch callback.
+
+    Events are collected as they arrive and handed to `callback(i3, events, received)` from a background
+    thread once no further event has arrived for `delay` seconds, or `max_delay` seconds after
+    the first event of the burst, whichever comes first. With no `delay` this just moves the callback
+    off the thread reading events, which then never waits for it.
+
+    Every relevant event is numbered with a generation, so that a callback can find out with `superseded`
+    whether newer events arrived while it was working.
+
+    Parameters
+    ----------
+    callback: `func`
+        Called with the connection, the list of collected events and the `time.monotonic()` each of them
+        was received at, eg. `WorkspaceRenamer.rename_events`.
+    delay: `float`
+        Quiet period, in seconds, that ends a burst.
+    max_delay: `float`
+        Upper bound, in seconds, on how long the first event of a burst is held back.
+    relevant: `func|None`
+        Called with each event, whether it should supersede the call in progress, eg.
+        `WorkspaceModel.relevant`. Every event does by default.
+    """
+
+    # how many times in a row a callback can give way to newer events, so that a steady stream of
+    # events can't hold back renames forever
+    MAX_SUPERSEDED = 3
+
+    def __init__(self, callback, delay, max_delay, relevant=None):
+        self.callback = callback
+        self.delay = delay
+        self.max_delay = max(delay, max_delay)
+        self.relevant = relevant
+        self._cond = threading.Condition()
+        self._events = []
+        self._received = []
+        # number of relevant events received, and of those handed to the callback
+        self._generation = self._taken = 0
+        self._superseded = 0
+        # when the oldest event handed to the callback was received
+        self._oldest = 0.0
+        self._i3 = None
+        self._first = self._last = 0.0
+        thread = threading.Thread(target=self._run, name='coalescer', daemon=True)
+        thread.start()
+
+    def __call__(self, i3, e):
+        now = time.monotonic()
+        with self._cond:
+            if not self._events:
+                self._first = now
+            self._events.append(e)
+            self._received.append(now)
+            if self.relevant is None or self.relevant(e):
+                self._generation += 1
+            self._last = now
+            self._i3 = i3
+            self._cond.notify()
+
+    def superseded(self):
+        """Whether events newer than the ones the callback is handling have arrived, and the callback should
+        leave the rest of its work to the next call, which gets those events. Only call from the callback.
+
+        Never once the oldest of the events has been waiting for `max_delay`."""
+        with self._cond:
+            if self._generation == self._taken or self._superseded >= self.MAX_SUPERSEDED \
+               or time.monotonic() - self._oldest >= self.max_delay:
+                return False
+            self._superseded += 1
+            return True
+
+    def _run(self):
+        carried = []
+        while True:
+            with self._cond:
+                while not self._events:
+                    self._cond.wait()
+                # events carried over from a call that gave way have been waiting for longer
+                first = min(self._first, carried[0]) if carried else self._first
+                while True:
+                    due = min(self._last + self.delay, first + self.max_delay)
+                    remaining = due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                events, self._events = self._events, []
+                received, self._received = carried + self._received, []
+                self._oldest = received[0] if received else time.monotonic()
+                i3 = self._i3
+                self._taken = self._generation
+                superseded = self._superseded
+            carried = []
+            try:
+                self.callback(i3, events, received)
+                if self._superseded > superseded:
+                    # these events are still waiting for their renames
+                    carried = received
+                else:
+                    self._superseded = 0
+            except Exception:
+                # keep the daemon alive, the next event will try again
+                traceback.print_exc()
+
+
+class CommandSender:
+    """Send commands to i3 from a background thread, so that the next events are handled while i3 replies.
+
+    Queued commands are sent one at a time, in the order they were queued.
+
+    Parameters
+    ----------
+    callback: `func`
+        Called with the arguments of each queued command, eg. `WorkspaceRenamer.send_command`.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+        self._queue = queue.Queue()
+        thread = threading.Thread(target=self._run, name='command-sender', daemon=True)
+        thread.start()
+
+    def __call__(self, *args):
+        self._queue.put(args)
+
+    def _run(self):
+        while True:
+            args = self._queue.get()
+            try:
+                self.callback(*args)
+            except Exception:
+                # the renamer has already marked the model stale, the next event will sync it
+                traceback.print_exc()
+
+
+class AsyncScheduler:
+    """Run rename passes on the asyncio event loop for events from an `i3ipc.aio.Connection`.
+
+    Event handlers only queue the event, the rename pass (and its `get_tree`/`command` requests)
+    runs in its own task so the connection keeps reading events while commands are in flight.
+    With a non-zero `delay`, events are coalesced the same way as by `Coalescer`.
+
+    Parameters
+    ----------
+    renamer: `WorkspaceRenamer`
+    delay: `float`
+        Quiet period, in seconds, that ends a burst.
+    max_delay: `float`
+        Upper bound, in seconds, on how long the first event of a burst is held back.
+    """
+
+    def __init__(self, renamer, delay=0.0, max_delay=0.0):
+        import asyncio
+
+        self.renamer = renamer
+        self.delay = delay
+        self.max_delay = max(delay, max_delay)
+        self._events = []
+        self._received = []
+        self._first = self._last = 0.0
+        self._wakeup = asyncio.Event()
+
+    def __call__(self, i3, e):
+        now = time.monotonic()
+        if not self._events:
+            self._first = now
+        self._events.append(e)
+        self._received.append(now)
+        self._last = now
+        self._wakeup.set()
+
+    def reload(self, rules):
+        """Swap in new app-icon rules and rename every workspace with them."""
+        self.renamer.set_rules(rules)
+        self._wakeup.set()
+
+    def rename_deferred(self):
+        """Bring the workspaces deferred as they're not shown up to date."""
+        self.renamer.undefer()
+        self._wakeup.set()
+
+    async def run(self, i3):
+        import asyncio
+
+        while True:
+            await self._wakeup.wait()
+            while self.delay:
+                remaining = min(self._last + self.delay, self._first + self.max_delay) - time.monotonic()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(remaining)
+            self._wakeup.clear()
+            events, self._events = self._events, []
+            received, self._received = self._received, []
+            try:
+                await self.renamer.rename_events_async(i3, events, received)
+            except Exception:
+                traceback.print_exc()
+
+
+class ConfigWatcher:
+    """Reload the app-icon config when it changes on disk.
+
+    A background thread watches the directory of the config file with inotify (or, where inotify
+    isn't available, by polling the file every couple of seconds). When the file is written,
+    replaced or removed the config is loaded and compiled again in that thread and the new rules
+    are passed to `callback`. A config that fails to load is reported and the old rules are kept.
+
+    Parameters
+    ----------
+    config_path: `str`
+        Resolved path of the app-icon config file, see `_get_config_path`.
+    callback: `func`
+        Called with the new `AppIconRules`, eg. `WorkspaceRenamer.reload`.
+    use_cache: `bool`
+        Use the on-disk rule cache, see `_get_rules`.
+    """
+
+    # IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    INOTIFY_MASK = 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+    POLL_INTERVAL = 2.0
+    # editors tend to write a file in several steps, wait for them to finish before reading it
+    SETTLE_DELAY = 0.1
+
+    def __init__(self, config_path, callback, use_cache=True):
+        self.config_path = config_path
+        self.callback = callback
+        self.use_cache = use_cache
+        thread = threading.Thread(target=self._run, name='config-watcher', daemon=True)
+        thread.start()
+
+    def _run(self):
+        try:
+            changes = self._inotify_changes()
+        except (AttributeError, OSError) as e:
+            print("Watching '{}' by polling, inotify is not available: {}".format(self.config_path, e))
+            changes = self._polled_changes()
+        for _ in changes:
+            try:
+                self._reload()
+            except Exception:
+                # keep watching, the next edit may well fix it
+                traceback.print_exc()
+
+    def _reload(self):
+        try:
+            rules, missing = _get_rules(self.config_path, self.use_cache)
+        except (ValueError, TypeError, OSError, re.error, SystemExit) as e:
+            print("Not reloading app-icon config '{}': {}".format(self.config_path, e))
+            return
+        print("Reloaded app-icon config '{}'".format(self.config_path))
+        for app, icon_name in missing:
+            print("Specified icon '{}' for app '{}' does not exist!".format(icon_name, app))
+        self.callback(rules)
+
+    def _inotify_changes(self):
+        import ctypes
+        import select
+        import struct
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        # a symlinked config (eg. from a dotfiles repository) changes where the link points to
+        directory, filename = os.path.split(os.path.realpath(self.config_path))
+        if libc.inotify_add_watch(fd, os.fsencode(directory), self.INOTIFY_MASK) < 0:
+            os.close(fd)
+            raise OSError(ctypes.get_errno(), 'inotify_add_watch failed')
+        filename = os.fsencode(filename)
+        header = struct.Struct('iIII')
+
+        def read_names():
+            data = os.read(fd, 65536)
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = header.unpack_from(data, offset)
+                offset += header.size
+                yield data[offset:offset + length].rstrip(b'\0')
+                offset += length
+
+        while True:
+            if filename not in list(read_names()):
+                continue
+            time.sleep(self.SETTLE_DELAY)
+            # drain whatever the rest of the write produced
+            while select.select([fd], [], [], 0)[0]:
+                list(read_names())
+            yield
+
+    def _polled_changes(self):
+        def stat():
+            try:
+                st = os.stat(self.config_path)
+                return st.st_ino, st.st_size, st.st_mtime_ns
+            except OSError:
+                return None
+
+        last = stat()
+        while True:
+            time.sleep(self.POLL_INTERVAL)
+            current = stat()
+            if current != last:
+                last = current
+                yield
+
 
-        # we have to join all the activate workspaces commands into one or the order
-        # might get scrambled by multiple i3-msg instances running asyncronously
-        # causing the wrong workspace to be activated last, which changes the focus.
-        i3.command(u';'.join(commands))
-    return rename
+def _toggle_profiler(renamer):
+    """Start profiling rename passes, or stop and write the stats to a file in the cache directory."""
+    if renamer.profiler is None:
+        import cProfile
+
+        renamer.profiler = cProfile.Profile()
+        print('Profiling rename passes, send SIGUSR1 again to stop and write the stats')
+        return
+    profiler, renamer.profiler = renamer.profiler, None
+    profiler.disable()
+    path = os.path.join(_get_cache_dir(), 'profile-{}-{}.pstats'.format(os.getpid(), int(time.time())))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        profiler.dump_stats(path)
+    except OSError as e:
+        print('Could not write profile: {}'.format(e))
+        return
+    print('Wrote rename profile to {}, view it with: python3 -m pstats {}'.format(path, path))
+
+
+def _dump_timings(renamer):
+    """Print the cumulative per-phase timings and write them to a file in the cache directory."""
+    report = renamer.timings.report()
+    print(report)
+    path = os.path.join(_get_cache_dir(), 'timings-{}.txt'.format(os.getpid()))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(report + '\n')
+    except OSError as e:
+        print('Could not write timings: {}'.format(e))
+
+
+def _install_signal_handlers(renamer, add_signal_handler=None):
+    """Profile on SIGUSR1 and dump per-phase timings on SIGUSR2.
+
+    Parameters
+    ----------
+    renamer: `WorkspaceRenamer`
+    add_signal_handler: `func|None`
+        `loop.add_signal_handler` when running on asyncio, `signal.signal` is used otherwise.
+    """
+    if add_signal_handler is None:
+        def add_signal_handler(signum, callback):
+            signal.signal(signum, lambda *_: callback())
+    add_signal_handler(signal.SIGUSR1, lambda: _toggle_profiler(renamer))
+    add_signal_handler(signal.SIGUSR2, lambda: _dump_timings(renamer))
+
+
+def _exit_on_signal(signum, frame):
+    raise SystemExit(0)
+
+
+async def _async_main(rules, args, config_path, startup, snapshot_path=None):
+    import asyncio
+    from i3ipc.aio import Connection
+
+    i3 = await Connection(args.socket_path).connect()
+    startup.mark('connect')
+    scheduler = AsyncScheduler(WorkspaceRenamer(rules, args), args.debounce_ms / 1000, args.max_delay_ms / 1000)
+    if snapshot_path is not None:
+        scheduler.renamer.warm(_read_cache(snapshot_path, scheduler.renamer.snapshot_key()))
+    for case in RENAME_EVENTS:
+        i3.on(case, scheduler)
+    _install_signal_handlers(scheduler.renamer, asyncio.get_event_loop().add_signal_handler)
+    asyncio.get_event_loop().add_signal_handler(signal.SIGTERM, i3.main_quit)
+    if args.stats_socket:
+        StatsServer(args.stats_socket, scheduler.renamer)
+    if args.output_scoped:
+        loop = asyncio.get_event_loop()
+        scheduler.renamer.deferred_pass = Coalescer(
+            lambda i3, events, received: loop.call_soon_threadsafe(scheduler.rename_deferred),
+            args.deferred_delay_ms / 1000, args.deferred_delay_ms / 1000)
+    if args.watch_config:
+        loop = asyncio.get_event_loop()
+        ConfigWatcher(config_path, lambda rules: loop.call_soon_threadsafe(scheduler.reload, rules),
+                      not args.no_rule_cache)
+    startup.mark('setup')
+    # events received meanwhile are queued for the worker, the subscriptions are sent before the tree is fetched
+    await scheduler.renamer.rename_all_async(i3)
+    startup.mark('initial rename')
+    worker = asyncio.ensure_future(scheduler.run(i3))
+    if args.startup_timing:
+        print(startup.report(), flush=True)
+    try:
+        await i3.main()
+    finally:
+        worker.cancel()
+        if snapshot_path is not None:
+            _write_cache(snapshot_path, scheduler.renamer.snapshot(), 'label snapshot')
+
+
+class StartupTimer:
+    """Time spent in each phase of starting the daemon, up to its initial rename, see `--startup-timing`.
+
+    The first phase covers starting the interpreter and importing the daemon, up to creating the timer.
+    It's taken from the start time of the process in /proc, so it's only accurate to a clock tick (usually
+    10ms) and missing where /proc isn't available.
+    """
+
+    def __init__(self):
+        self.phases = []
+        self._last = time.perf_counter()
+        age = _process_age()
+        if age is not None:
+            self.phases.append(('interpreter+imports', age))
+
+    def mark(self, phase):
+        """Record the time since the previous phase ended as the time taken by `phase`."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def report(self):
+        """Format the phases as a table, one phase per line and their total."""
+        lines = ['{:<20} {:>10}'.format('startup phase', 'ms')]
+        lines.extend('{:<20} {:>10.1f}'.format(phase, seconds * 1000) for phase, seconds in self.phases)
+        lines.append('{:<20} {:>10.1f}'.format('total', sum(seconds for _, seconds in self.phases) * 1000))
+        return '\n'.join(lines)
+
+
+def _process_age():
+    """Get the seconds since this process started, or None when that isn't known."""
+    try:
+        with open('/proc/self/stat') as f:
+            # the command name in parentheses may contain spaces, starttime is the 20th field after it
+            started = int(f.read().rsplit(')', 1)[1].split()[19]) / os.sysconf('SC_CLK_TCK')
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - started
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def build_rename(i3, app_icons, args):
+    """Build rename callback function to pass to i3ipc.
+
+    Parameters
+    ----------
+    i3: `i3ipc.i3ipc.Connection`
+    app_icons: `dict[str, str|dict]|AppIconRules`
+        Index of application-name regex (from i3) to icon-name (in font-awesome gallery), or the compiled rules.
+    args: `argparse.Namespace`
+        Parsed command line options, eg. `delimiter` to use when building workspace names from app names/icons.
+
+    Returns
+    -------
+    WorkspaceRenamer
+        The rename callback.
+    """
+    rules = app_icons if isinstance(app_icons, AppIconRules) else AppIconRules(app_icons)
+    return WorkspaceRenamer(rules, args)
+
+
+def _load_tree(path):
+    """Parse a tree saved with `i3-msg -t get_tree`, from stdin when `path` is '-'."""
+    try:
+        if path == '-':
+            data = json.load(sys.stdin)
+        else:
+            with open(path) as f:
+                data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise SystemExit("Could not read i3 tree '{}': {}".format(path, e))
+    return i3ipc.Con(data, None, None)
+
+
+def _get_offline_rules(args):
+    """Get the rules for --from-tree, the default ones when there is neither a config nor an i3 config
+    directory, eg. on a machine without a display."""
+    if args.config_path is None and not any(os.path.isdir(path) for path in I3_CONFIG_PATHS):
+        print('Using default app-icon config {}'.format(DEFAULT_APP_ICON_CONFIG))
+        return AppIconRules(dict(DEFAULT_APP_ICON_CONFIG))
+    rules, missing = _get_rules(args.config_path, not args.no_rule_cache)
+    for app, icon_name in missing:
+        print("Specified icon '{}' for app '{}' does not exist!".format(icon_name, app))
+    return rules
+
+
+def _name_trees(rules, args):
+    """Print the renames for each of the saved trees in `args.from_tree`, see --from-tree."""
+    rename = WorkspaceRenamer(rules, args)
+    # the commands are the output already
+    rename.verbose = False
+    for path in args.from_tree:
+        commands, names = rename.name_tree(_load_tree(path))
+        if args.json:
+            print(json.dumps(names, ensure_ascii=False))
+        else:
+            for command in commands:
+                print(command)
+    if args.verbose:
+        print(rename.timings.report(), file=sys.stderr)
+
+
+class _MatchTimeout(Exception):
+    pass
+
+
+@contextlib.contextmanager
+def _match_limit(seconds):
+    """Interrupt the matching in the block with `_MatchTimeout` once it took `seconds`, where SIGALRM is available."""
+    if not hasattr(signal, 'setitimer'):
+        yield
+        return
+
+    def expire(signum, frame):
+        raise _MatchTimeout()
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _adversarial_titles(name_re):
+    """Yield series of titles, one of each of `LINT_TITLE_LENGTHS`, likely to make `name_re` backtrack.
+
+    The titles of a series repeat a character (or two), eg. one the pattern itself contains, after the
+    literal start of the pattern, so that the repetitions in it get to them. They either end there, with
+    a newline or with a character the pattern is unlikely to match at the end.
+    """
+    prefix = re.match(r'[^.^$*+?{}\[\]\\|()]*', name_re.lstrip('^')).group(0)
+    units = ['a', '0', ' ', '-', '/', '.', 'ab', 'a ']
+    units.extend(sorted(set(c for c in name_re if c.isalnum() or c in ' -_/:') - set(units)))
+    for unit in units:
+        for end in ('', '!', '\n'):
+            yield [prefix + unit * (length // len(unit)) + end for length in LINT_TITLE_LENGTHS]
+
+
+def _time_match(rule_set, title, repeat=3):
+    """Get the fastest of `repeat` matches of `title`, in seconds.
+
+    Raises
+    ------
+    _MatchTimeout
+        When a match takes longer than `LINT_MATCH_LIMIT`.
+    """
+    best = None
+    with _match_limit(LINT_MATCH_LIMIT * repeat):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            rule_set.match(title)
+            seconds = time.perf_counter() - start
+            if seconds > LINT_MATCH_LIMIT:
+                raise _MatchTimeout()
+            best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def _lint_rule(name_re, value, titles):
+    """Check one entry of the app-icon config, see --lint-config.
+
+    Parameters
+    ----------
+    name_re: `str`
+        Application-name regex.
+    value: `str|dict`
+        The icon-name, or object with the icon-name, the regex maps to.
+    titles: `list[str]`
+        Captured titles to time the rule against, besides the adversarial ones.
+
+    Returns
+    -------
+    (list[str], float|None, int|None)
+        The problems found, the slowest match in seconds and the length of the title it took that long on.
+        The time is `LINT_MATCH_LIMIT` when the match was interrupted, None when the rule doesn't compile.
+    """
+    problems = []
+    try:
+        icon_name, _ = _parse_rule(name_re, value)
+    except ValueError as e:
+        return [str(e)], None, None
+    if lookup_icon(icon_name) is None:
+        problems.append("unknown icon '{}', the rule never matches".format(icon_name))
+    try:
+        groups = re.compile(name_re, re.IGNORECASE).groups
+    except re.error as e:
+        return problems + ['invalid regex: {}'.format(e)], None, None
+
+    # timed the way the daemon matches it, ie. looked up in an index when it's a plain name
+    rule_set = _RuleSet([(name_re, '')], [groups])
+    worst, worst_length = 0.0, 0
+    try:
+        for title in titles:
+            seconds = _time_match(rule_set, title)
+            if seconds > worst:
+                worst, worst_length = seconds, len(title)
+        growth = None
+        # plain names are looked up in an index, there's nothing to backtrack
+        for series in _adversarial_titles(name_re) if _literal_rule(name_re) is None else ():
+            times = []
+            for title in series:
+                seconds = _time_match(rule_set, title)
+                times.append(seconds)
+                if seconds > worst:
+                    worst, worst_length = seconds, len(title)
+            # the last title but two is a quarter as long, a rule linear in the title takes about 4 times as long on the last
+            if times[-1] > LINT_NOISE_FLOOR and times[-1] > 8 * times[-3]:
+                exponent = math.log(times[-1] / times[-3]) / math.log(len(series[-1]) / len(series[-3]))
+                growth = max(growth or 0, exponent)
+        if growth is not None:
+            problems.append('super-linear, the match time grows like (title length)^{:.1f}'.format(growth))
+    except _MatchTimeout:
+        worst, worst_length = LINT_MATCH_LIMIT, len(title)
+        problems.append('{}, a match of a {} character title took over {:g}ms'.format(
+            'catastrophic backtracking' if len(title) < 256 else 'super-linear', len(title), LINT_MATCH_LIMIT * 1000))
+    return problems, worst, worst_length
+
+
+def _lint_config(args):
+    """Compile and time every app-icon rule and print the slowest match of each, see --lint-config.
+
+    Returns
+    -------
+    int
+        The number of rules with problems.
+    """
+    app_icons = _get_app_icons(args.config_path)
+    titles = list(LINT_TITLES)
+    for path in args.from_tree or ():
+        for leaf in _load_tree(path).leaves():
+            titles.extend(name for name in _leaf_from_con(leaf)[1:] if name and name not in titles)
+
+    print('{:>12} {:>7}  {}'.format('worst_us', 'length', 'rule'))
+    flagged = 0
+    slowest = (None, 0.0)
+    for name_re, value in app_icons.items():
+        problems, worst, length = _lint_rule(name_re, value, titles)
+        if worst is None:
+            print('{:>12} {:>7}  {}'.format('-', '-', json.dumps(name_re, ensure_ascii=False)))
+        else:
+            print('{}{:>11.1f} {:>7}  {}'.format('>' if worst >= LINT_MATCH_LIMIT else ' ', worst * 1e6, length,
+                                                   json.dumps(name_re, ensure_ascii=False)))
+            if worst > slowest[1]:
+                slowest = (name_re, worst)
+        for problem in problems:
+            print('{:>22}{}'.format('! ', problem))
+        flagged += bool(problems)
+    print('{} rules, {} with problems, timed against {} captured titles and adversarial ones of up to {} characters'.format(
+        len(app_icons), flagged, len(titles), LINT_TITLE_LENGTHS[-1]), end='')
+    print(', slowest {} ({:.1f}us)'.format(json.dumps(slowest[0], ensure_ascii=False), slowest[1] * 1e6)
+          if slowest[0] is not None else '')
+    return flagged
 
 
 def _get_i3_dir():
@@ -111,6 +1946,33 @@ def _get_i3_dir():
     raise SystemExit("Could not find i3 config directory! Expected one of {} to be present".format(I3_CONFIG_PATHS))
 
 
+def _get_config_path(config_path=None):
+    """Resolve the path of the app-icon config file.
+
+    Parameters
+    ----------
+    config_path: `str|None`
+        Path to app-icon config file, as given on the command line.
+
+    Returns
+    -------
+    str
+        `config_path`, or app-icons.json in the i3 config directory when `config_path` is None.
+        The latter may not exist.
+
+    Raises
+    ------
+    SystemExit
+        When `config_path is not None` and there is not a file available at that path.
+        When ~/.i3 or ~/.config/i3 is not a directory (ie. i3 is not installed).
+    """
+    if config_path:
+        if not os.path.isfile(config_path):
+            raise SystemExit("Specified app-icon config path '{}' does not exist".format(config_path))
+        return config_path
+    return os.path.join(_get_i3_dir(), "app-icons.json")
+
+
 def _get_app_icons(config_path=None):
     """Get app-icon mapping from config file or use defaults.
 
@@ -121,7 +1983,7 @@ def _get_app_icons(config_path=None):
 
     Returns
     -------
-    dict[str,str]
+    dict[str,str|dict]
         Index of application-name (from i3) to icon-name (in font-awesome gallery).
 
     Raises
@@ -129,6 +1991,9 @@ def _get_app_icons(config_path=None):
     json.decoder.JSONDecodeError
         When app-icon config file is not in JSON format.
 
+    ValueError
+        When the app-icon config is not a JSON object.
+
     SystemExit
         When `config_path is not None` and there is not a file available at tht path.
         When ~/.i3 or ~/.config/i3 is not a directory (ie. i3 is not installed).
@@ -138,22 +2003,123 @@ def _get_app_icons(config_path=None):
     If config_path is None then the locations ~/.i3/app-icons.json and ~/.config/i3/app-icons.json will also be used if available. If they are also not available then `DEFAULT_APP_ICON_CONFIG` will be used.
     """
 
-    if config_path:
-        if not os.path.isfile(config_path):
-            raise SystemExit("Specified app-icon config path '{}' does not exist".format(config_path))
-    else:
-        config_path = os.path.join(_get_i3_dir(), "app-icons.json")
-
+    config_path = _get_config_path(config_path)
     if os.path.isfile(config_path):
         with open(config_path) as f:
-            app_icons = json.load(f)
-        # normalise app-names to lower
-        return {k.lower(): v for k, v in app_icons.items()}
+            return _normalise_app_icons(json.load(f))
     else:
         print('Using default app-icon config {}'.format(DEFAULT_APP_ICON_CONFIG))
         return dict(DEFAULT_APP_ICON_CONFIG)
 
 
+def _normalise_app_icons(app_icons):
+    """Check that a parsed app-icon config is an object and lower-case its app-names.
+
+    Raises
+    ------
+    ValueError
+        When the config is valid JSON, but not an object.
+    """
+    if not isinstance(app_icons, dict):
+        raise ValueError('App-icon config must be a JSON object mapping app-names to icons, not {}'.format(
+            type(app_icons).__name__))
+    return {k.lower(): v for k, v in app_icons.items()}
+
+
+def _missing_icons(app_icons):
+    """Get the (application-name, icon-name) pairs whose icon isn't in the font-awesome gallery."""
+    icon_names = [(app, _parse_rule(app, value)[0]) for app, value in app_icons.items()]
+    return [(app, icon_name) for app, icon_name in icon_names if lookup_icon(icon_name) is None]
+
+
+def _get_cache_dir():
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'i3-workspace-names-daemon')
+
+
+def _cache_path(config_path, kind):
+    # one cache file per config file, so switching between configs doesn't thrash a single entry
+    digest = hashlib.sha1(os.path.abspath(config_path).encode('utf-8', 'surrogateescape')).hexdigest()
+    return os.path.join(_get_cache_dir(), '{}-{}.marshal'.format(kind, digest[:16]))
+
+
+def _read_cache(cache_path, key):
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(cached, dict) or cached.get('key') != key:
+        return None
+    return cached
+
+
+def _write_cache(cache_path, cached, description):
+    try:
+        os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+        tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+        # only readable by the user, whatever the umask
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            marshal.dump(cached, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print("Could not write {} '{}': {}".format(description, cache_path, e))
+
+
+def _get_rules(config_path=None, use_cache=True):
+    """Get the compiled app-icon rules, from the on-disk rule cache when the config hasn't changed.
+
+    The cache holds the validated rule table, with every icon resolved to its glyph, under
+    $XDG_CACHE_HOME/i3-workspace-names-daemon. It's keyed by the content hash of the config file and
+    the version of the icon table, so a hit skips parsing, normalising and validating the config.
+
+    Parameters
+    ----------
+    config_path: `str|None`
+        Path to app-icon config file, see `_get_app_icons`.
+    use_cache: `bool`
+        Read and write the rule cache.
+
+    Returns
+    -------
+    (AppIconRules, list[(str, str)])
+        The rules and the (application-name, icon-name) pairs whose icon doesn't exist.
+
+    Raises
+    ------
+    json.decoder.JSONDecodeError
+        When app-icon config file is not in JSON format.
+
+    ValueError
+        When the app-icon config is not a JSON object.
+
+    SystemExit
+        See `_get_app_icons`.
+    """
+    path = _get_config_path(config_path)
+    if not os.path.isfile(path):
+        app_icons = _get_app_icons(config_path)
+        return AppIconRules(app_icons), _missing_icons(app_icons)
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    key = '{}:{}:{}'.format(RULE_CACHE_VERSION, fa_icons_table.VERSION, hashlib.sha256(data).hexdigest())
+    cache_path = _cache_path(path, 'rules')
+    cached = _read_cache(cache_path, key) if use_cache else None
+    if cached is not None:
+        return AppIconRules.from_resolved(cached['rules'], cached['no_match'], cached['groups'],
+                                          cached['targets']), cached['missing']
+
+    app_icons = _normalise_app_icons(json.loads(data.decode('utf-8')))
+    rules = AppIconRules(app_icons)
+    missing = _missing_icons(app_icons)
+    if use_cache:
+        _write_cache(cache_path, {'key': key, 'rules': rules.resolved, 'groups': rules.groups,
+                                  'targets': rules.targets, 'no_match': rules.no_match, 'missing': missing},
+                     'app-icon rule cache')
+    return rules, missing
+
+
 def _verbose_startup(i3):
     for w in i3.get_tree().workspaces():
         print('WORKSPACE: "{}"'.format(w.name))
@@ -166,10 +2132,14 @@ def _verbose_startup(i3):
 
 
 def main():
+    startup = StartupTimer()
     parser = argparse.ArgumentParser(__doc__)
     parser.add_argument("-config-path",
                         help="Path to file that maps applications to icons in json format. Defaults to ~/.i3/app-icons.json or ~/.config/i3/app-icons.json or hard-coded list if they are not available.",
                         required=False)
+    parser.add_argument("--socket-path",
+                        help="Path to the i3 IPC socket. Defaults to $I3SOCK or the socket of the running i3.",
+                        required=False)
     parser.add_argument("-d", "--delimiter",
                         help="The delimiter used to separate multiple window names in the same workspace.",
                         required=False,
@@ -189,24 +2159,173 @@ def main():
                         action="store_true",
                         required=False,
                         default=False)
+    parser.add_argument("--debounce-ms",
+                        help="Collect window events arriving within this many milliseconds of each other and rename once for all of them. Disabled by default.",
+                        required=False,
+                        default=0,
+                        type=int)
+    parser.add_argument("--max-delay-ms",
+                        help="Upper bound on how long an event is held back by --debounce-ms.",
+                        required=False,
+                        default=200,
+                        type=int)
+    parser.add_argument("--worker",
+                        help="Rename from a worker thread, so that events keep being read during a rename pass. Implied by --debounce-ms.",
+                        action="store_true",
+                        required=False,
+                        default=False)
+    parser.add_argument("--rule-budget-ms",
+                        help="Time an app-icon rule may spend in a spell of slow matches before it's ignored. Disabled by default.",
+                        required=False,
+                        default=0,
+                        type=int)
+    parser.add_argument("--max-match-length",
+                        help="Only match the first this many characters of window names and titles against the app-icon rules, 0 for all of them.",
+                        required=False,
+                        default=0,
+                        type=int)
+    parser.add_argument("--label-cache-size",
+                        help="Number of windows to remember the computed name/icon for.",
+                        required=False,
+                        default=1024,
+                        type=int)
+    parser.add_argument("--async",
+                        help="Run on asyncio with i3ipc.aio, so that events keep being read while commands are sent to i3.",
+                        dest="use_async",
+                        action="store_true",
+                        required=False,
+                        default=False)
+    parser.add_argument("--watch-config",
+                        help="Reload the app-icon config whenever it changes, without restarting the daemon.",
+                        action="store_true",
+                        required=False,
+                        default=False)
+    parser.add_argument("--no-rule-cache",
+                        help="Don't keep the validated app-icon rules in $XDG_CACHE_HOME between restarts.",
+                        action="store_true",
+                        required=False,
+                        default=False)
+    parser.add_argument("--output-scoped",
+                        help="Rename workspaces that aren't shown on any output only once they're shown or focused, or --deferred-delay-ms later.",
+                        action="store_true",
+                        required=False,
+                        default=False)
+    parser.add_argument("--deferred-delay-ms",
+                        help="How long workspaces that aren't shown may lag behind with --output-scoped.",
+                        required=False,
+                        default=1000,
+                        type=int)
+    parser.add_argument("--stats-socket",
+                        help="Serve event, rename, cache and latency counters as JSON on this Unix socket.",
+                        required=False)
+    parser.add_argument("--no-snapshot",
+                        help="Don't keep the labels of the windows in $XDG_CACHE_HOME between restarts.",
+                        action="store_true",
+                        required=False,
+                        default=False)
+    parser.add_argument("--from-tree",
+                        help="Print the renames for trees saved with `i3-msg -t get_tree` (- for stdin) and exit, without connecting to i3.",
+                        nargs="+",
+                        metavar="FILE",
+                        required=False)
+    parser.add_argument("--json",
+                        help="With --from-tree, print the new name of each workspace by its current name as a JSON object per tree, rather than the rename commands.",
+                        action="store_true",
+                        required=False,
+                        default=False)
+    parser.add_argument("--lint-config",
+                        help="Check the app-icon config for invalid rules, unknown icons and rules that are slow on long titles (also timed against the titles in any --from-tree) and exit.",
+                        action="store_true",
+                        required=False,
+                        default=False)
+    parser.add_argument("--startup-timing",
+                        help="Print how long each phase of starting up took, up to subscribing to events.",
+                        action="store_true",
+                        required=False,
+                        default=False)
     args = parser.parse_args()
+    startup.mark('arguments')
 
-    app_icons = _get_app_icons(args.config_path)
+    if args.from_tree and not args.lint_config:
+        # diagnostics go to stderr, stdout is kept for the commands or JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            rules = _get_offline_rules(args)
+        _name_trees(rules, args)
+        return
+    config_path = _get_config_path(args.config_path)
+    if args.lint_config:
+        if _lint_config(args):
+            raise SystemExit(1)
+        return
+    rules, missing = _get_rules(args.config_path, not args.no_rule_cache)
 
     # check for missing icons
-    for app, icon_name in app_icons.items():
-        if not icon_name in icons:
-            print("Specified icon '{}' for app '{}' does not exist!".format(icon_name, app))
+    for app, icon_name in missing:
+        print("Specified icon '{}' for app '{}' does not exist!".format(icon_name, app))
+    snapshot_path = None if args.no_snapshot else _cache_path(config_path, 'labels')
+    startup.mark('config')
+
+    if args.use_async:
+        import asyncio
+
+        if args.verbose:
+            _verbose_startup(i3ipc.Connection(args.socket_path))
+        asyncio.run(_async_main(rules, args, config_path, startup, snapshot_path))
+        return
 
     # build i3-connection
-    i3 = i3ipc.Connection()
+    i3 = i3ipc.Connection(args.socket_path)
     if args.verbose:
         _verbose_startup(i3)
+    startup.mark('connect')
+
+    rename = build_rename(i3, rules, args)
+    rename.sender = CommandSender(rename.send_command)
+    if snapshot_path is not None:
+        rename.warm(_read_cache(snapshot_path, rename.snapshot_key()))
+    _install_signal_handlers(rename)
+    if args.stats_socket:
+        StatsServer(args.stats_socket, rename)
+    if args.output_scoped:
+        rename.deferred_pass = Coalescer(lambda i3, events, received: rename.rename_deferred(i3),
+                                         args.deferred_delay_ms / 1000, args.deferred_delay_ms / 1000)
+    if args.watch_config:
+        ConfigWatcher(config_path, lambda rules: rename.reload(i3, rules), not args.no_rule_cache)
+    handler = rename
+    if args.debounce_ms > 0 or args.worker:
+        # only passes run by the coalescer can give way to the events queued behind them, not eg. a reload
+        handler = Coalescer(lambda i3, events, received: rename.rename_events(i3, events, received, handler.superseded),
+                            args.debounce_ms / 1000, args.max_delay_ms / 1000, lambda e: rename.model.relevant(e))
+    for case in RENAME_EVENTS:
+        i3.on(case, handler)
+
+    started = False
 
-    rename = build_rename(i3, app_icons, args)
-    for case in ['window::move', 'window::new', 'window::title', 'window::close']:
-        i3.on(case, rename)
-    i3.main()
+    def on_tick(i3, e):
+        nonlocal started
+        # i3 sends a first tick as soon as the subscription is in place (only i3 4.15 leaves `first` out),
+        # so no event is missed between the tree the initial pass reads and the events that follow it
+        if e.first is False:
+            return
+        if not started:
+            startup.mark('subscribe')
+        # workspaces keep whatever names they had when the daemon (or i3) restarted until they're renamed
+        rename.rename_all(i3)
+        if not started:
+            started = True
+            startup.mark('initial rename')
+            if args.startup_timing:
+                print(startup.report(), flush=True)
+    i3.on('tick', on_tick)
+    startup.mark('setup')
+    # unwind on SIGTERM too, so that the snapshot gets written
+    signal.signal(signal.SIGTERM, _exit_on_signal)
+    try:
+        # subscribes to the events, then handles them, starting with the first tick
+        i3.main()
+    finally:
+        if snapshot_path is not None:
+            _write_cache(snapshot_path, rename.snapshot(), 'label snapshot')
 
 
 if __name__ == '__main__':
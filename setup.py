@@ -12,7 +12,7 @@ setup(name='i3-workspace-names-daemon',
       url='https://github.com/cboddy/i3-workspace-names-daemon',
       license='MIT',
       zip_safe=False,
-      py_modules=['i3_workspace_names_daemon', 'fa_icons'],
+      py_modules=['i3_workspace_names_daemon', 'fa_icons', 'fa_icons_table'],
       install_requires=["i3ipc"],
       author='Chris Boddy',
       author_email='chris@boddy.im',